@@ -0,0 +1,3 @@
+"""
+Shared tooling for running the `dayNN_*.py` solvers
+"""
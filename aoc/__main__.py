@@ -0,0 +1,377 @@
+"""
+Usage:
+    python -m aoc [--log debug] run --day 5 --part 2 [--input path]
+    python -m aoc run --day 7 --part 1 --stream --input - < hands.txt
+    python -m aoc run --day 1 --part 1 --vectorized --input huge.txt
+    python -m aoc run --day 1 --part 2 --chunked [--workers N] --input huge.txt
+    python -m aoc run --day 12 --part 2 --profile profiles/
+    python -m aoc run --day 11 --part 2 --memory
+    python -m aoc run --day 5 --part 2 --trace trace.json
+    python -m aoc run-all [--workers N] [--profile profiles/] [--memory] [--trace trace.json] [--no-cache]
+    python -m aoc batch --day 5 --part 2 'tenants/*.txt' [--workers N] [--output results.jsonl]
+    python -m aoc bench [--day 5] [--part 2] [--memory] [--save baseline.json] [--baseline baseline.json]
+    python -m aoc bench --day 11 --size 500 [--seed 1]
+    python -m aoc complexity [--day 11] [--part 1] [--save curves.json]
+    python -m aoc serve [--socket path] [--concurrency 4] [--workers N]
+    python -m aoc query --day 5 --part 2 [--input path | --stdin]
+    python -m aoc follow game_log.txt [--checkpoint path] [--interval 1.0] [--once]
+    python -m aoc generate --day 10 --size 1000 --output big.txt [--seed 1]
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import sys
+import time
+
+from aoc import output, profiling, registry, tracing
+
+
+def run(args: argparse.Namespace) -> None:
+    if args.memory:
+        from aoc import memory
+
+        if args.stream or args.vectorized or args.chunked or args.profile:
+            sys.exit("--memory can't be combined with --stream, --vectorized, --chunked or --profile")
+        solver_memory, answer = memory.measure(registry.load_module(args.day, args.part),
+                                               args.input)
+        output.answer(answer)
+        print(memory.format_memory(solver_memory), file=sys.stderr)
+        return
+
+    # Before the solver module is imported, so its counters and spans are live
+    if args.trace:
+        tracing.enable()
+        tracing.name_process(registry.label(args.day, args.part))
+    if args.profile:
+        profiling.enable()
+
+    if args.stream + args.vectorized + args.chunked > 1:
+        sys.exit("--stream, --vectorized and --chunked are exclusive")
+    if args.stream:
+        solve = registry.solve_stream
+    elif args.vectorized:
+        solve = registry.solve_vectorized
+    elif args.chunked:
+        from aoc import chunked
+
+        solve = functools.partial(chunked.solve_chunked, max_workers=args.workers)
+    elif args.profile or args.trace:
+        solve = registry.solve
+    else:
+        solve = registry.solve_memoized
+
+    if not args.profile:
+        answer = solve(args.day, args.part, args.input)
+    else:
+        dump_file = profiling.dump_path(args.profile, registry.label(args.day, args.part))
+        answer = profiling.profile_call(lambda: solve(args.day, args.part, args.input), dump_file)
+
+    with tracing.span("output"):
+        output.answer(answer)
+
+    if args.profile:
+        print(profiling.format_summary(profiling.snapshot()), file=sys.stderr)
+        print(f"Profile written to {dump_file}", file=sys.stderr)
+    if args.trace:
+        tracing.write_trace(args.trace, tracing.events())
+        print(f"Trace written to {args.trace}", file=sys.stderr)
+
+
+def run_parallel(args: argparse.Namespace) -> None:
+    from aoc import memory, run_all
+
+    start = time.perf_counter()
+    results = run_all.run_all(registry.select(),
+                              max_workers=args.workers,
+                              on_result=run_all.report_progress,
+                              profile_dir=args.profile,
+                              trace_memory=args.memory,
+                              trace=args.trace is not None,
+                              use_cache=not args.no_cache)
+
+    for result in results:
+        print(result)
+    if args.trace:
+        tracing.write_trace(args.trace,
+                            [event for result in results for event in result.trace_events])
+        print(f"Trace written to {args.trace}", file=sys.stderr)
+    if args.profile:
+        for result in results:
+            print(f"\n{result.label}\n{profiling.format_summary(result.counters)}")
+    if args.memory:
+        for result in results:
+            if result.memory_usage is not None:
+                print(f"\n{result.label}\n{memory.format_memory(result.memory_usage)}")
+    print(f"Total wall time: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if any(result.error for result in results):
+        sys.exit(1)
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    from aoc import batch
+
+    results = batch.solve_batch(args.day, args.part,
+                                batch.iter_inputs(args.inputs),
+                                max_workers=args.workers)
+    failed = 0
+    with (open(args.output, "w") if args.output else sys.stdout) as out:
+        for result in results:
+            failed += result["error"] is not None
+            out.write(json.dumps(result, default=str) + "\n")
+
+    if failed:
+        sys.exit(f"{failed} inputs failed")
+
+
+def run_bench(args: argparse.Namespace) -> None:
+    from aoc import bench
+
+    warmup = bench.DEFAULT_WARMUP if args.warmup is None else args.warmup
+    repeat = bench.DEFAULT_REPEAT if args.repeat is None else args.repeat
+    threshold = bench.DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+    keys = registry.select(args.day, args.part)
+    if args.input is not None and len(keys) != 1:
+        sys.exit("--input needs both --day and --part")
+    if args.input is not None and args.size is not None:
+        sys.exit("--input and --size are exclusive")
+
+    if args.size is not None:
+        results = bench.bench_generated(keys, args.size,
+                                        seed=args.seed,
+                                        warmup=warmup,
+                                        repeat=repeat,
+                                        trace_memory=args.memory)
+    else:
+        results = bench.bench_all(keys,
+                                  input_file=args.input,
+                                  warmup=warmup,
+                                  repeat=repeat,
+                                  trace_memory=args.memory)
+    print(bench.format_table(results))
+
+    if args.save:
+        bench.save_baseline(results, args.save)
+
+    if args.baseline:
+        regressions = bench.find_regressions(results,
+                                             bench.load_baseline(args.baseline),
+                                             threshold=threshold)
+        if regressions:
+            print("Regressions:")
+            print("\n".join(regressions))
+            sys.exit(1)
+
+
+def run_complexity(args: argparse.Namespace) -> None:
+    from aoc import complexity
+
+    curves = []
+    for curve in complexity.measure_curves(
+            registry.select(args.day, args.part),
+            seed=args.seed,
+            repeat=complexity.DEFAULT_REPEAT if args.repeat is None else args.repeat,
+            tolerance=complexity.DEFAULT_TOLERANCE if args.tolerance is None else args.tolerance):
+        print(complexity.format_curve(curve), end="\n\n", flush=True)
+        curves.append(curve)
+
+    flagged = [curve.label for curve in curves if curve.flagged]
+    if flagged:
+        print("Super-linear: " + ", ".join(flagged))
+
+    if args.save:
+        complexity.save_curves(curves, args.save)
+
+
+def serve(args: argparse.Namespace) -> None:
+    from aoc import daemon
+
+    socket_path = args.socket or daemon.SOCKET_PATH
+    print(f"Serving on {socket_path}", file=sys.stderr)
+    daemon.serve(socket_path,
+                 concurrency=args.concurrency or daemon.DEFAULT_CONCURRENCY,
+                 workers=args.workers)
+
+
+def query(args: argparse.Namespace) -> None:
+    from aoc import daemon
+
+    text = sys.stdin.read() if args.stdin else None
+    response = daemon.request(args.day, args.part,
+                              input_file=args.input,
+                              text=text,
+                              socket_path=args.socket or daemon.SOCKET_PATH)
+    if response["error"]:
+        sys.exit(response["error"])
+
+    print(response["answer"])
+    if response["cached"]:
+        print("cached", file=sys.stderr)
+    else:
+        print(f"parse {response['parse_ms']:.2f} ms, solve {response['solve_ms']:.2f} ms",
+              file=sys.stderr)
+
+
+def follow(args: argparse.Namespace) -> None:
+    from aoc import game_log
+
+    follower = game_log.GameLogFollower(args.log_file, checkpoint_file=args.checkpoint)
+    if args.once:
+        follower.update()
+        checkpoints = [follower.checkpoint]
+    else:
+        checkpoints = follower.follow(game_log.DEFAULT_INTERVAL if args.interval is None
+                                      else args.interval)
+
+    with contextlib.suppress(KeyboardInterrupt):
+        for checkpoint in checkpoints:
+            print(json.dumps({"offset": checkpoint.offset,
+                              "games": checkpoint.games,
+                              "part1": checkpoint.id_sum,
+                              "part2": checkpoint.power_sum}), flush=True)
+
+
+def generate(args: argparse.Namespace) -> None:
+    from aoc import generators
+
+    generators.write_input(args.day, args.size, args.output, seed=args.seed)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc")
+    parser.add_argument("--log", choices=output.LEVELS, default=None,
+                        help="stderr log level, defaults to $AOC_LOG or info")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="solve a single day/part")
+    run_parser.add_argument("--day", type=int, required=True)
+    run_parser.add_argument("--part", type=int, required=True)
+    run_parser.add_argument("--input", default=None,
+                            help="input file, defaults to the module's INPUT_FILE")
+    run_parser.add_argument("--stream", action="store_true",
+                            help="constant memory solve line by line, '-' reads stdin")
+    run_parser.add_argument("--vectorized", action="store_true",
+                            help="NumPy solve over the whole mapped input")
+    run_parser.add_argument("--chunked", action="store_true",
+                            help="sum the answers of newline-aligned ranges solved in parallel")
+    run_parser.add_argument("--workers", type=int, default=None,
+                            help="worker processes of --chunked, defaults to the CPU count")
+    run_parser.add_argument("--profile", metavar="DIR", default=None,
+                            help="dump cProfile stats to DIR and print the solver's counters")
+    run_parser.add_argument("--memory", action="store_true",
+                            help="trace peak memory and allocations of parse and solve")
+    run_parser.add_argument("--trace", metavar="PATH", default=None,
+                            help="write a Chrome trace of the read, parse, solve and output spans")
+    run_parser.set_defaults(func=run)
+
+    run_all_parser = subparsers.add_parser("run-all", help="solve every day/part on a process pool")
+    run_all_parser.add_argument("--workers", type=int, default=None,
+                                help="number of worker processes, defaults to the CPU count")
+    run_all_parser.add_argument("--profile", metavar="DIR", default=None,
+                                help="dump cProfile stats of every solver to DIR")
+    run_all_parser.add_argument("--memory", action="store_true",
+                                help="trace memory of every solver on an extra run")
+    run_all_parser.add_argument("--trace", metavar="PATH", default=None,
+                                help="write a Chrome trace of every worker's spans")
+    run_all_parser.add_argument("--no-cache", action="store_true",
+                                help="solve every day/part instead of answering from the result memo")
+    run_all_parser.set_defaults(func=run_parallel)
+
+    batch_parser = subparsers.add_parser("batch", help="solve one day/part over many inputs")
+    batch_parser.add_argument("--day", type=int, required=True)
+    batch_parser.add_argument("--part", type=int, required=True)
+    batch_parser.add_argument("inputs", help="directory or glob of input files")
+    batch_parser.add_argument("--workers", type=int, default=None,
+                              help="number of worker processes, defaults to the CPU count")
+    batch_parser.add_argument("--output", default=None,
+                              help="write the JSONL results here instead of stdout")
+    batch_parser.set_defaults(func=run_batch)
+
+    bench_parser = subparsers.add_parser("bench", help="time parse and solve of every day/part")
+    bench_parser.add_argument("--day", type=int, default=None)
+    bench_parser.add_argument("--part", type=int, default=None)
+    bench_parser.add_argument("--input", default=None,
+                              help="input file, only with a single --day and --part")
+    bench_parser.add_argument("--size", type=int, default=None,
+                              help="benchmark on generated inputs of this size instead")
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--warmup", type=int, default=None,
+                              help="untimed runs before timing, defaults to 1")
+    bench_parser.add_argument("--repeat", type=int, default=None,
+                              help="timed runs, defaults to 5")
+    bench_parser.add_argument("--memory", action="store_true",
+                              help="also trace memory on an extra untimed run")
+    bench_parser.add_argument("--save", default=None,
+                              help="write the results as a JSON baseline")
+    bench_parser.add_argument("--baseline", default=None,
+                              help="fail if any phase regressed against this JSON baseline")
+    bench_parser.add_argument("--threshold", type=float, default=None,
+                              help="allowed slowdown ratio of the median, defaults to 0.2")
+    bench_parser.set_defaults(func=run_bench)
+
+    complexity_parser = subparsers.add_parser("complexity",
+                                              help="fit how each solver scales on generated inputs")
+    complexity_parser.add_argument("--day", type=int, default=None)
+    complexity_parser.add_argument("--part", type=int, default=None)
+    complexity_parser.add_argument("--seed", type=int, default=0)
+    complexity_parser.add_argument("--repeat", type=int, default=None,
+                                   help="timed runs per size, defaults to 3")
+    complexity_parser.add_argument("--tolerance", type=float, default=None,
+                                   help="allowed exponent above the expected one, defaults to 0.3")
+    complexity_parser.add_argument("--save", default=None,
+                                   help="write the curves as JSON")
+    complexity_parser.set_defaults(func=run_complexity)
+
+    serve_parser = subparsers.add_parser("serve", help="keep solvers warm behind a Unix socket")
+    serve_parser.add_argument("--socket", default=None,
+                              help="defaults to $AOC_SOCKET or a path in the temp directory")
+    serve_parser.add_argument("--concurrency", type=int, default=None,
+                              help="requests solved at once, defaults to 4")
+    serve_parser.add_argument("--workers", type=int, default=None,
+                              help="processes for the CPU heavy days, defaults to the CPU count")
+    serve_parser.set_defaults(func=serve)
+
+    query_parser = subparsers.add_parser("query", help="ask the daemon for an answer")
+    query_parser.add_argument("--day", type=int, required=True)
+    query_parser.add_argument("--part", type=int, required=True)
+    query_input = query_parser.add_mutually_exclusive_group()
+    query_input.add_argument("--input", default=None,
+                             help="input file, defaults to the module's INPUT_FILE")
+    query_input.add_argument("--stdin", action="store_true",
+                             help="send the input read from stdin")
+    query_parser.add_argument("--socket", default=None,
+                              help="defaults to $AOC_SOCKET or a path in the temp directory")
+    query_parser.set_defaults(func=query)
+
+    follow_parser = subparsers.add_parser("follow",
+                                          help="keep both day 2 answers of a growing game log")
+    follow_parser.add_argument("log_file", metavar="log", help="append-only file of game records")
+    follow_parser.add_argument("--checkpoint", default=None,
+                               help="state file, defaults to <log>.checkpoint.json")
+    follow_parser.add_argument("--interval", type=float, default=None,
+                               help="seconds between polls, defaults to 1.0")
+    follow_parser.add_argument("--once", action="store_true",
+                               help="ingest what was appended, print the answers and exit")
+    follow_parser.set_defaults(func=follow)
+
+    generate_parser = subparsers.add_parser("generate", help="write a synthetic input")
+    generate_parser.add_argument("--day", type=int, required=True)
+    generate_parser.add_argument("--size", type=int, required=True)
+    generate_parser.add_argument("--output", required=True)
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.set_defaults(func=generate)
+
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.log is not None:
+        output.set_level(args.log)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Batch mode: solve one day/part over many input files
+
+Inputs come from a directory or a glob and are fanned out across worker
+processes, each importing the solver once. Results are yielded as they
+finish with only a bounded window of inputs in flight, so memory doesn't
+grow with the number of inputs.
+"""
+
+import glob
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator, Optional
+
+from aoc import registry
+
+# Inputs queued per worker, enough to keep every worker busy
+IN_FLIGHT_PER_WORKER = 4
+
+
+def iter_inputs(source: str) -> Iterator[str]:
+    """
+    Files of a directory, or the matches of a glob, in name order
+    """
+    if os.path.isdir(source):
+        with os.scandir(source) as entries:
+            paths = sorted(entry.path for entry in entries if entry.is_file())
+    else:
+        paths = sorted(glob.iglob(source, recursive=True))
+
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+
+
+def _solve_one(input_file: str) -> dict[str, Any]:
+    try:
+        answer, parse_ms, solve_ms, hit = registry.run_memoized(registry.worker_module(), input_file)
+    except Exception as e:
+        return {"input": input_file, "answer": None,
+                "parse_ms": None, "solve_ms": None, "cached": False, "error": repr(e)}
+
+    return {"input": input_file, "answer": answer,
+            "parse_ms": parse_ms, "solve_ms": solve_ms, "cached": hit, "error": None}
+
+
+def solve_batch(day: int,
+                part: int,
+                inputs: Iterable[str],
+                max_workers: Optional[int] = None) -> Iterator[dict[str, Any]]:
+    """
+    One result per input, in completion order
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    inputs = iter(inputs)
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=registry.init_worker,
+                             initargs=(day, part)) as executor:
+        window = max_workers * IN_FLIGHT_PER_WORKER
+        pending: set[Future] = {executor.submit(_solve_one, input_file)
+                                for input_file in itertools.islice(inputs, window)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            for input_file in itertools.islice(inputs, len(done)):
+                pending.add(executor.submit(_solve_one, input_file))
@@ -0,0 +1,233 @@
+"""
+Benchmark harness timing the parse and solve phases of each solver separately
+
+Each phase is warmed up, repeated and summarised with percentiles.
+Results can be saved as a JSON baseline and later runs compared against it.
+"""
+
+import json
+import math
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from aoc import generators, memory, parse_cache, registry
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.2
+# Ignore regressions smaller than this, sub-millisecond phases are mostly noise
+DEFAULT_MIN_DELTA_MS = 1.0
+# Same for memory, small peaks move with interpreter internals
+DEFAULT_MIN_DELTA_BYTES = 64 * 1024
+
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class PhaseStats:
+    runs: int
+    min_ms: float
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "PhaseStats":
+        p50, p90, p99 = (percentile(samples, p) for p in PERCENTILES)
+        return cls(runs=len(samples),
+                   min_ms=min(samples),
+                   mean_ms=sum(samples) / len(samples),
+                   p50_ms=p50,
+                   p90_ms=p90,
+                   p99_ms=p99)
+
+
+@dataclass
+class BenchResult:
+    day: int
+    part: int
+    parse: PhaseStats
+    solve: PhaseStats
+    memory_usage: Optional[memory.SolverMemory] = None
+
+    @property
+    def key(self) -> str:
+        return registry.label(self.day, self.part)
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """
+    Linear interpolation between the closest ranks
+    """
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * p / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def _time_ms(func: Callable[[], Any]) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def bench_solver(day: int,
+                 part: int,
+                 input_file: Optional[str] = None,
+                 warmup: int = DEFAULT_WARMUP,
+                 repeat: int = DEFAULT_REPEAT,
+                 trace_memory: bool = False) -> BenchResult:
+    """
+    Every run parses afresh, so solvers that mutate their input
+    (sorting, replacing the start tile...) never see a used one.
+    The parse cache is bypassed, so the parse phase times the parser.
+    Memory is traced on one extra run after the timed ones.
+    """
+    module = registry.load_module(day, part)
+
+    parse_samples = []
+    solve_samples = []
+    with parse_cache.disabled():
+        for run in range(warmup + repeat):
+            parse_ms, parsed = _time_ms(lambda: registry.parse_input(module, input_file))
+            solve_ms, _ = _time_ms(lambda: registry.run_solver(module, parsed))
+
+            if run < warmup:
+                continue
+            parse_samples.append(parse_ms)
+            solve_samples.append(solve_ms)
+
+    solver_memory = None
+    if trace_memory:
+        solver_memory, _ = memory.measure(module, input_file)
+
+    return BenchResult(day=day,
+                       part=part,
+                       parse=PhaseStats.from_samples(parse_samples),
+                       solve=PhaseStats.from_samples(solve_samples),
+                       memory_usage=solver_memory)
+
+
+def bench_all(keys: Iterable[tuple[int, int]],
+              input_file: Optional[str] = None,
+              warmup: int = DEFAULT_WARMUP,
+              repeat: int = DEFAULT_REPEAT,
+              trace_memory: bool = False) -> list[BenchResult]:
+    return [bench_solver(day, part,
+                         input_file=input_file,
+                         warmup=warmup,
+                         repeat=repeat,
+                         trace_memory=trace_memory)
+            for day, part in keys]
+
+
+def bench_generated(keys: Iterable[tuple[int, int]],
+                    size: int,
+                    seed: int = 0,
+                    warmup: int = DEFAULT_WARMUP,
+                    repeat: int = DEFAULT_REPEAT,
+                    trace_memory: bool = False) -> list[BenchResult]:
+    """
+    Benchmark on synthetic inputs of the given size, both parts of a day share one input
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="aoc-bench-") as tmp_dir:
+        for day, part in keys:
+            input_file = os.path.join(tmp_dir, f"day{day}.txt")
+            if not os.path.exists(input_file):
+                generators.write_input(day, size, input_file, seed=seed)
+            results.append(bench_solver(day, part,
+                                        input_file=input_file,
+                                        warmup=warmup,
+                                        repeat=repeat,
+                                        trace_memory=trace_memory))
+
+    return results
+
+
+def save_baseline(results: list[BenchResult], path: str) -> None:
+    baseline = {}
+    for result in results:
+        baseline[result.key] = {"parse": asdict(result.parse),
+                                "solve": asdict(result.solve)}
+        if result.memory_usage is not None:
+            baseline[result.key]["memory"] = {"parse": asdict(result.memory_usage.parse),
+                                              "solve": asdict(result.memory_usage.solve)}
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+
+
+def load_baseline(path: str) -> dict[str, dict[str, dict[str, Any]]]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def find_regressions(results: list[BenchResult],
+                     baseline: dict[str, dict[str, dict[str, Any]]],
+                     threshold: float = DEFAULT_THRESHOLD,
+                     min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+                     min_delta_bytes: int = DEFAULT_MIN_DELTA_BYTES) -> list[str]:
+    """
+    Compare medians and peak memory against the baseline,
+    solvers missing from it are skipped and memory only when both sides traced it
+    """
+    regressions = []
+    for result in results:
+        if result.key not in baseline:
+            continue
+
+        for phase in ("parse", "solve"):
+            current = getattr(result, phase).p50_ms
+            previous = baseline[result.key][phase]["p50_ms"]
+            if current - previous < min_delta_ms:
+                continue
+            if current > previous * (1 + threshold):
+                regressions.append(f"{result.key} {phase}: "
+                                   f"{previous:.2f} ms -> {current:.2f} ms "
+                                   f"(+{(current / previous - 1) * 100:.0f}%)")
+
+        if result.memory_usage is None or "memory" not in baseline[result.key]:
+            continue
+        for phase in ("parse", "solve"):
+            current = getattr(result.memory_usage, phase).peak_bytes
+            previous = baseline[result.key]["memory"][phase]["peak_bytes"]
+            if current - previous < min_delta_bytes:
+                continue
+            if current > previous * (1 + threshold):
+                regressions.append(f"{result.key} {phase} peak: "
+                                   f"{previous / 1024:.1f} KiB -> {current / 1024:.1f} KiB "
+                                   f"(+{(current / max(previous, 1) - 1) * 100:.0f}%)")
+
+    return regressions
+
+
+def format_table(results: list[BenchResult]) -> str:
+    header = f"{'solver':<14}{'phase':<7}{'min':>10}{'p50':>10}{'p90':>10}{'p99':>10}  (ms)"
+    rows = [header]
+    for result in results:
+        for phase in ("parse", "solve"):
+            stats = getattr(result, phase)
+            rows.append(f"{result.key:<14}{phase:<7}"
+                        f"{stats.min_ms:>10.2f}{stats.p50_ms:>10.2f}"
+                        f"{stats.p90_ms:>10.2f}{stats.p99_ms:>10.2f}")
+
+    traced = [result for result in results if result.memory_usage is not None]
+    if traced:
+        rows.append("")
+        rows.append(f"{'solver':<14}{'phase':<7}{'peak':>12}{'retained':>12}{'net blocks':>12}  (KiB)")
+        for result in traced:
+            for phase in ("parse", "solve"):
+                usage = getattr(result.memory_usage, phase)
+                rows.append(f"{result.key:<14}{phase:<7}"
+                            f"{usage.peak_bytes / 1024:>12.1f}{usage.retained_bytes / 1024:>12.1f}"
+                            f"{usage.net_blocks:>+12}")
+
+    return "\n".join(rows)
@@ -0,0 +1,108 @@
+"""
+Chunked mode: one solve split over newline-aligned byte ranges of the input
+
+For solvers whose answer is a sum over independent lines, the file is cut
+into byte ranges ending right after a newline, each worker process maps the
+file and solves the lines of its own range, and the parent adds up the
+partial answers. The parent only reads the few bytes around each cut.
+Run `python -m aoc.chunked` for the speedup against the number of workers.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from aoc import registry
+from aoc.mapped import iter_lines
+
+# Solvers whose answer is the sum of the answers of any split of their lines
+ADDITIVE_SOLVERS = {(1, 1), (1, 2)}
+
+# Ranges per worker, so a worker done early picks up more of the file
+CHUNKS_PER_WORKER = 4
+
+# Below this, a range isn't worth the round trip to a worker
+MIN_CHUNK_BYTES = 1024 * 1024
+
+
+def line_ranges(input_file: str, chunks: int) -> list[tuple[int, int]]:
+    """
+    At most `chunks` [start, stop) byte ranges covering the file, each cut right after a newline
+    """
+    size = os.path.getsize(input_file)
+    ranges = []
+    with open(input_file, "rb") as f:
+        start = 0
+        for index in range(1, chunks):
+            cut = max(start, size * index // chunks)
+            f.seek(cut)
+            # Carry the line crossing the cut over to this range
+            stop = cut + len(f.readline()) if cut else 0
+            if stop > start:
+                ranges.append((start, stop))
+                start = stop
+        if start < size:
+            ranges.append((start, size))
+
+    return ranges
+
+
+def _solve_range(input_file: str, start: int, stop: int) -> int:
+    return registry.get_solver(registry.worker_module())(iter_lines(input_file, start, stop))
+
+
+def solve_chunked(day: int,
+                  part: int,
+                  input_file: Optional[str] = None,
+                  max_workers: Optional[int] = None) -> int:
+    if (day, part) not in ADDITIVE_SOLVERS:
+        raise ValueError(f"Day {day} part {part} can't be solved in chunks")
+    if input_file is None:
+        input_file = registry.load_module(day, part).INPUT_FILE
+
+    max_workers = max_workers or os.cpu_count() or 1
+    size = os.path.getsize(input_file)
+    chunks = max(1, min(max_workers * CHUNKS_PER_WORKER, size // MIN_CHUNK_BYTES))
+    ranges = line_ranges(input_file, chunks)
+    if len(ranges) <= 1:
+        return registry.solve(day, part, input_file)
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(ranges)),
+                             initializer=registry.init_worker,
+                             initargs=(day, part)) as executor:
+        partials = executor.map(_solve_range,
+                                [input_file] * len(ranges),
+                                *zip(*ranges))
+        return sum(partials)
+
+
+def _benchmark() -> None:
+    import random
+    import tempfile
+    import time
+
+    from aoc.generators import calibration_lines
+
+    max_workers = os.cpu_count() or 1
+    worker_counts = sorted({1, max_workers} | {2 ** n for n in range(max_workers.bit_length())})
+    with tempfile.TemporaryDirectory(prefix="aoc-chunked-") as tmp_dir:
+        input_file = os.path.join(tmp_dir, "day1.txt")
+        with open(input_file, "w") as f:
+            f.write(calibration_lines(2_000_000, random.Random(0)))
+        print(f"{os.path.getsize(input_file) / 2 ** 20:.0f} MiB, {max_workers} CPUs")
+
+        for part in (1, 2):
+            start = time.perf_counter()
+            registry.solve(1, part, input_file)
+            serial_s = time.perf_counter() - start
+            print(f"part {part}  serial      {serial_s * 1000:>8.0f} ms")
+            for workers in worker_counts:
+                start = time.perf_counter()
+                solve_chunked(1, part, input_file, max_workers=workers)
+                chunked_s = time.perf_counter() - start
+                print(f"part {part}  {workers:>2} workers  {chunked_s * 1000:>8.0f} ms"
+                      f"  {serial_s / chunked_s:>5.2f}x")
+
+
+if __name__ == "__main__":
+    _benchmark()
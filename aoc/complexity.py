@@ -0,0 +1,197 @@
+"""
+Complexity curves: how each solver scales with the size of its input
+
+Every solver runs on generated inputs of growing size, and the growth exponent
+is fitted on a log-log scale of input bytes against time, so 1.0 is linear,
+and linear in the cells for the grid days. Only the largest `FIT_POINTS` sizes
+are fitted, fixed overheads dominate the smallest ones. Solvers growing faster
+than their `EXPECTED_EXPONENTS` entry plus the tolerance are flagged.
+"""
+
+import json
+import math
+import os
+import random
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator, Optional
+
+from aoc import bench, generators, memory, registry
+
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.3
+FIT_POINTS = 3
+
+# Generator sizes per day, doubling; the grids (3, 10, 11) grow by their side, and the
+# day 12 records by their number of groups (see `CURVE_GENERATORS`)
+DEFAULT_SIZES = {
+    1: [1000, 2000, 4000, 8000],
+    2: [1000, 2000, 4000, 8000],
+    3: [50, 100, 200, 400],
+    4: [1000, 2000, 4000, 8000],
+    5: [50, 100, 200, 400],
+    6: [4, 8, 16, 32],
+    7: [1000, 2000, 4000, 8000],
+    8: [1000, 2000, 4000, 8000],
+    9: [500, 1000, 2000, 4000],
+    10: [20, 40, 80, 160],
+    11: [50, 100, 200, 400],
+    12: [1, 2, 3, 4, 5, 6],
+}
+
+# Generators of the days whose curves grow something else than the usual input size:
+# day 12 rows have a bounded length otherwise, which hides how a row's cost grows
+CURVE_GENERATORS: dict[int, generators.Generator] = {12: generators.spring_rows}
+
+# Growth of each solver in its input bytes, as the problem allows rather than as measured,
+# so a solver doing worse than its problem needs is flagged
+EXPECTED_EXPONENTS: dict[tuple[int, int], float] = {
+    # One pass over the lines
+    (1, 1): 1.0,
+    (1, 2): 1.0,
+    (2, 1): 1.0,
+    (2, 2): 1.0,
+    # One pass over the cells
+    (3, 1): 1.0,
+    (3, 2): 1.0,
+    (4, 1): 1.0,
+    (4, 2): 1.0,
+    # Each seed looks up every map of a layer
+    (5, 1): 1.0,
+    # Every range is checked against every map of its layer, and the ranges split as the maps grow
+    (5, 2): 2.0,
+    # Part 1 tries every hold time of races of bounded length, part 2 is closed form after the read
+    (6, 1): 1.0,
+    (6, 2): 1.0,
+    # Sorting the hands, n log n is within the tolerance
+    (7, 1): 1.0,
+    (7, 2): 1.0,
+    # Walks bounded by the ghost loop lengths, which the generator keeps proportional to the nodes
+    (8, 1): 1.0,
+    (8, 2): 1.0,
+    # Difference rows of fixed length
+    (9, 1): 1.0,
+    (9, 2): 1.0,
+    # A walk along the loop and a scan of the cells
+    (10, 1): 1.0,
+    (10, 2): 1.0,
+    # Distances are sums over the sorted rows and columns of the galaxies, so looping over
+    # every pair of galaxies, whose number grows with the square of the cells, is flagged
+    (11, 1): 1.0,
+    (11, 2): 1.0,
+    # Counting memoized on (spring, group) grows with the springs times the groups of a row,
+    # so backtracking over every unknown spring, exponential in the row, is flagged
+    (12, 1): 2.0,
+    (12, 2): 2.0,
+}
+
+
+@dataclass
+class CurvePoint:
+    size: int
+    input_bytes: int
+    parse_ms: float
+    solve_ms: float
+    peak_bytes: int
+
+    @property
+    def total_ms(self) -> float:
+        return self.parse_ms + self.solve_ms
+
+
+@dataclass
+class Curve:
+    day: int
+    part: int
+    points: list[CurvePoint]
+    exponent: float
+    expected: float
+    flagged: bool
+
+    @property
+    def label(self) -> str:
+        return registry.label(self.day, self.part)
+
+
+def fit_exponent(xs: list[float], ys: list[float]) -> float:
+    """
+    Least squares slope of log(y) against log(x)
+    """
+    log_xs = [math.log(x) for x in xs]
+    log_ys = [math.log(max(y, 1e-6)) for y in ys]
+    mean_x = sum(log_xs) / len(log_xs)
+    mean_y = sum(log_ys) / len(log_ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(log_xs, log_ys))
+    variance = sum((x - mean_x) ** 2 for x in log_xs)
+
+    return covariance / variance if variance else 0.0
+
+
+def measure_curve(day: int,
+                  part: int,
+                  sizes: Optional[list[int]] = None,
+                  seed: int = 0,
+                  repeat: int = DEFAULT_REPEAT,
+                  tolerance: float = DEFAULT_TOLERANCE) -> Curve:
+    sizes = sizes or DEFAULT_SIZES[day]
+    points = []
+    with tempfile.TemporaryDirectory(prefix="aoc-complexity-") as tmp_dir:
+        for size in sizes:
+            input_file = os.path.join(tmp_dir, f"day{day}_{size}.txt")
+            generator = CURVE_GENERATORS.get(day, generators.GENERATORS[day])
+            with open(input_file, "w") as f:
+                f.write(generator(size, random.Random(seed)))
+            result = bench.bench_solver(day, part,
+                                        input_file=input_file,
+                                        warmup=0,
+                                        repeat=repeat)
+            solver_memory, _ = memory.measure(registry.load_module(day, part), input_file)
+            points.append(CurvePoint(size=size,
+                                     input_bytes=os.path.getsize(input_file),
+                                     parse_ms=result.parse.p50_ms,
+                                     solve_ms=result.solve.p50_ms,
+                                     peak_bytes=solver_memory.peak_bytes))
+
+    fitted = points[-FIT_POINTS:]
+    exponent = fit_exponent([point.input_bytes for point in fitted],
+                            [point.total_ms for point in fitted])
+    expected = EXPECTED_EXPONENTS[(day, part)]
+
+    return Curve(day=day,
+                 part=part,
+                 points=points,
+                 exponent=exponent,
+                 expected=expected,
+                 flagged=exponent > expected + tolerance)
+
+
+def measure_curves(keys: Iterable[tuple[int, int]],
+                   seed: int = 0,
+                   repeat: int = DEFAULT_REPEAT,
+                   tolerance: float = DEFAULT_TOLERANCE) -> Iterator[Curve]:
+    """
+    One curve per solver, yielded as soon as it is measured
+    """
+    for day, part in keys:
+        yield measure_curve(day, part, seed=seed, repeat=repeat, tolerance=tolerance)
+
+
+def format_curve(curve: Curve) -> str:
+    flag = "  <-- super-linear" if curve.flagged else ""
+    rows = [f"{curve.label}: exponent {curve.exponent:.2f} (expected {curve.expected:.2f}){flag}",
+            f"{'size':>8}{'bytes':>12}{'parse ms':>12}{'solve ms':>12}{'peak KiB':>12}"]
+    for point in curve.points:
+        rows.append(f"{point.size:>8}{point.input_bytes:>12}"
+                    f"{point.parse_ms:>12.2f}{point.solve_ms:>12.2f}"
+                    f"{point.peak_bytes / 1024:>12.1f}")
+
+    return "\n".join(rows)
+
+
+def save_curves(curves: list[Curve], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump({curve.label: {"exponent": curve.exponent,
+                                 "expected": curve.expected,
+                                 "flagged": curve.flagged,
+                                 "points": [asdict(point) for point in curve.points]}
+                   for curve in curves}, f, indent=2)
@@ -0,0 +1,152 @@
+"""
+Warm solver daemon answering requests over a local Unix socket
+
+Every answer from the command line pays for an interpreter start and the
+solver's imports. The daemon keeps solver modules imported, and parsed inputs
+warm through the in-memory layer of `parse_cache`. It answers one JSON request
+per line:
+
+    {"day": 5, "part": 2, "input": "/abs/path.txt"}   or   {"day": 5, "part": 2, "text": "..."}
+
+with one JSON response per line:
+
+    {"answer": 6082852, "parse_ms": 0.4, "solve_ms": 3.1, "cached": false, "error": null}
+
+Requests without "input" and "text" use the solver's own INPUT_FILE, and
+answers already in `result_cache` come back with "cached": true. At most
+`concurrency` requests are solved at once. Light days run on threads of the
+daemon itself, and the CPU heavy days in `POOL_DAYS` go to a process pool whose
+long-lived workers keep their own imports warm.
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import signal
+import socket
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Optional
+
+from aoc import registry
+
+SOCKET_PATH = os.environ.get("AOC_SOCKET",
+                             os.path.join(tempfile.gettempdir(), f"aoc-{os.getuid()}.sock"))
+DEFAULT_CONCURRENCY = 4
+
+# Days whose solve takes long enough to be worth a round trip to another process
+POOL_DAYS = {10, 11, 12}
+
+
+def solve_request(request: dict[str, Any]) -> dict[str, Any]:
+    """
+    Answer a single request, failures are reported instead of raised
+    """
+    try:
+        day = int(request["day"])
+        part = int(request["part"])
+        if "text" in request:
+            answer, parse_ms, solve_ms, hit = _solve_text(day, part, request["text"])
+        else:
+            answer, parse_ms, solve_ms, hit = registry.run_memoized(registry.load_module(day, part),
+                                                                    request.get("input"))
+    except Exception as e:
+        return {"answer": None, "parse_ms": None, "solve_ms": None, "cached": False,
+                "error": repr(e)}
+
+    return {"answer": answer, "parse_ms": parse_ms, "solve_ms": solve_ms, "cached": hit,
+            "error": None}
+
+
+def _solve_text(day: int, part: int, text: str) -> tuple[Any, float, float, bool]:
+    """
+    Solvers read (and map) files, so inline inputs go through a temporary one
+    """
+    with tempfile.NamedTemporaryFile("w", prefix="aoc-daemon-", suffix=".txt") as f:
+        f.write(text)
+        f.flush()
+        return registry.run_memoized(registry.load_module(day, part), f.name)
+
+
+class SolverDaemon:
+    def __init__(self,
+                 socket_path: str = SOCKET_PATH,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 workers: Optional[int] = None) -> None:
+        self.socket_path = socket_path
+        self.limit = asyncio.Semaphore(concurrency)
+        self.threads = ThreadPoolExecutor(max_workers=concurrency)
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+
+    def _executor(self, day: int) -> Executor:
+        return self.pool if day in POOL_DAYS else self.threads
+
+    async def _handle(self,
+                      reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    executor = self._executor(int(request["day"]))
+                except Exception as e:
+                    response = {"answer": None, "parse_ms": None, "solve_ms": None,
+                                "cached": False, "error": f"bad request: {e!r}"}
+                else:
+                    async with self.limit:
+                        response = await loop.run_in_executor(executor, solve_request, request)
+
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+        server = await asyncio.start_unix_server(self._handle,
+                                                 path=self.socket_path,
+                                                 limit=2 ** 30)
+        # Shut down cleanly on SIGTERM too, removing the socket file
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM,
+                                                      asyncio.current_task().cancel)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.threads.shutdown(cancel_futures=True)
+            self.pool.shutdown(cancel_futures=True)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+
+
+def serve(socket_path: str = SOCKET_PATH,
+          concurrency: int = DEFAULT_CONCURRENCY,
+          workers: Optional[int] = None) -> None:
+    daemon = SolverDaemon(socket_path, concurrency=concurrency, workers=workers)
+    with contextlib.suppress(KeyboardInterrupt, asyncio.CancelledError):
+        asyncio.run(daemon.serve_forever())
+
+
+def request(day: int,
+            part: int,
+            input_file: Optional[str] = None,
+            text: Optional[str] = None,
+            socket_path: str = SOCKET_PATH) -> dict[str, Any]:
+    """
+    Client side of a single request, relative paths are resolved here
+    as the daemon may run from another directory
+    """
+    message: dict[str, Any] = {"day": day, "part": part}
+    if text is not None:
+        message["text"] = text
+    elif input_file is not None:
+        message["input"] = os.path.abspath(input_file)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(message).encode() + b"\n")
+        with client.makefile("rb") as response:
+            return json.loads(response.readline())
@@ -0,0 +1,61 @@
+"""
+Sort more items than fit in memory
+
+Items are sorted in chunks, chunks that don't fit are spilled to temporary
+files, and the sorted chunks are lazily merged back together.
+"""
+
+import heapq
+import itertools
+import pickle
+import tempfile
+from typing import IO, Any, Callable, Iterable, Iterator, Optional
+
+DEFAULT_CHUNK_SIZE = 100000
+
+
+def _spill(chunk: list[Any]) -> IO[bytes]:
+    f = tempfile.TemporaryFile()
+    pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+    for item in chunk:
+        pickler.dump(item)
+    f.seek(0)
+
+    return f
+
+
+def _read_spilled(f: IO[bytes]) -> Iterator[Any]:
+    unpickler = pickle.Unpickler(f)
+    while True:
+        try:
+            yield unpickler.load()
+        except EOFError:
+            return
+
+
+def external_sorted(items: Iterable[Any],
+                    key: Optional[Callable[[Any], Any]] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    At most `chunk_size` items are held in memory while sorting,
+    inputs that fit in a single chunk never touch the disk
+    """
+    items = iter(items)
+    spilled = []
+    try:
+        while True:
+            chunk = list(itertools.islice(items, chunk_size))
+            chunk.sort(key=key)
+            if len(chunk) < chunk_size and not spilled:
+                yield from chunk
+                return
+            if chunk:
+                spilled.append(_spill(chunk))
+            if len(chunk) < chunk_size:
+                break
+            del chunk
+
+        yield from heapq.merge(*(_read_spilled(f) for f in spilled), key=key)
+    finally:
+        for f in spilled:
+            f.close()
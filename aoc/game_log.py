@@ -0,0 +1,112 @@
+"""
+Follow an append-only log of day 2 game records
+
+Both day 2 answers are sums over games, so new games only add to them: the
+follower keeps the byte offset of the last complete line it parsed with the
+running part 1 and part 2 sums, and each update parses just the bytes appended
+since. The state is checkpointed to a JSON file after every update, so a
+restarted follower picks up where it stopped instead of re-reading the log.
+
+A log that shrank or whose bytes before the offset changed was rewritten
+rather than appended to, and is ingested again from the start.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import BinaryIO, Iterator, Optional
+
+from aoc import registry
+from aoc.game_records import GameRecords
+
+# Bytes before the offset compared on resume, to tell an append from a rewrite
+FINGERPRINT_BYTES = 64
+DEFAULT_INTERVAL = 1.0
+
+
+@dataclass
+class Checkpoint:
+
+    offset: int = 0
+    fingerprint: str = ""
+    games: int = 0
+    id_sum: int = 0
+    power_sum: int = 0
+    # Part 1 sums are only valid for the bag they were counted with
+    bag: list[int] = field(default_factory=list)
+
+
+class GameLogFollower:
+
+    def __init__(self,
+                 log_file: str,
+                 checkpoint_file: Optional[str] = None,
+                 bag: Optional[tuple[int, int, int]] = None) -> None:
+        self.log_file = log_file
+        self.checkpoint_file = checkpoint_file or f"{log_file}.checkpoint.json"
+        if bag is None:
+            part1 = registry.load_module(2, 1)
+            bag = (part1.MAX_RED, part1.MAX_GREEN, part1.MAX_BLUE)
+        self.bag = bag
+        self.checkpoint = self._load()
+
+    def _load(self) -> Checkpoint:
+        try:
+            with open(self.checkpoint_file, "r") as f:
+                checkpoint = Checkpoint(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return Checkpoint(bag=list(self.bag))
+
+        return checkpoint if checkpoint.bag == list(self.bag) else Checkpoint(bag=list(self.bag))
+
+    def _save(self) -> None:
+        tmp_file = f"{self.checkpoint_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(asdict(self.checkpoint), f)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    @staticmethod
+    def _fingerprint(f: BinaryIO, offset: int) -> str:
+        start = max(0, offset - FINGERPRINT_BYTES)
+        f.seek(start)
+        return f.read(offset - start).hex()
+
+    def update(self) -> bool:
+        """
+        Ingest the complete lines appended since the last update, True if any
+        """
+        with open(self.log_file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            offset = self.checkpoint.offset
+            if size < offset or self._fingerprint(f, offset) != self.checkpoint.fingerprint:
+                self.checkpoint = Checkpoint(bag=list(self.bag))
+                offset = 0
+
+            f.seek(offset)
+            appended = f.read(size - offset)
+            # A line still being written is left for the next update
+            complete = appended.rfind(b"\n") + 1
+            if not complete:
+                return False
+            games = GameRecords.from_buffer(appended[:complete])
+
+        tail = bytes.fromhex(self.checkpoint.fingerprint) + appended[:complete]
+        self.checkpoint = Checkpoint(offset=offset + complete,
+                                     fingerprint=tail[-FINGERPRINT_BYTES:].hex(),
+                                     games=self.checkpoint.games + len(games),
+                                     id_sum=self.checkpoint.id_sum + games.id_sum(*self.bag),
+                                     power_sum=self.checkpoint.power_sum + games.power_sum(),
+                                     bag=list(self.bag))
+        self._save()
+        return True
+
+    def follow(self, interval: float = DEFAULT_INTERVAL) -> Iterator[Checkpoint]:
+        """
+        The checkpoint after every update that ingested new games, polling forever
+        """
+        while True:
+            if self.update():
+                yield self.checkpoint
+            time.sleep(interval)
+
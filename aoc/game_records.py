@@ -0,0 +1,165 @@
+"""
+Columnar store of day 2 game records
+
+A game only matters through its number and the most cubes of each color shown
+at once, so the records are kept as four int64 columns instead of an object
+and a dict per game. They are filled in one vectorized pass over the raw
+bytes: every run of digits is a number, the byte after its end tells what it
+counts ("Game 12:" ends on a colon, "3 blue" has a color initial one byte
+later), and the game numbers cut the numbers into one segment per game, whose
+per-color maxima are a single `np.maximum.reduceat`.
+
+Both parts are then reductions over the columns, and `BagIndex` answers part 1
+for many bags at once. Run `python -m aoc.game_records` to compare with parsing
+line by line.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+from aoc.integers import digit_runs
+
+COLON = ord(":")
+# First letter of each color, in column order
+COLOR_INITIALS = b"rgb"
+# Lines parsed at once when streaming
+BATCH_LINES = 4096
+
+
+@dataclass
+class GameRecords:
+
+    game_no: np.ndarray
+    max_red: np.ndarray
+    max_green: np.ndarray
+    max_blue: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.game_no)
+
+    @classmethod
+    def from_buffer(cls, buffer: Union[bytes, bytearray, memoryview, np.ndarray]) -> "GameRecords":
+        data = np.frombuffer(buffer, dtype=np.uint8) if not isinstance(buffer, np.ndarray) else buffer
+        _, ends, values = digit_runs(data)
+        if not len(values):
+            return cls.empty()
+
+        games = np.flatnonzero(data[np.minimum(ends, len(data) - 1)] == COLON)
+        if not len(games) or games[0] != 0:
+            raise ValueError("Game records must start with 'Game <no>:'")
+
+        # The color initial sits after the space following the count
+        initials = data[np.minimum(ends + 1, len(data) - 1)]
+        maxima = [np.maximum.reduceat(np.where(initials == initial, values, 0), games)
+                  for initial in COLOR_INITIALS]
+
+        return cls(values[games], *maxima)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "GameRecords":
+        return cls.from_buffer("\n".join(lines).encode())
+
+    @classmethod
+    def empty(cls) -> "GameRecords":
+        return cls(*(np.zeros(0, dtype=np.int64) for _ in range(4)))
+
+    def possible(self, red: int, green: int, blue: int) -> np.ndarray:
+        """
+        Mask of the games a bag of these many cubes could have played
+        """
+        return (self.max_red <= red) & (self.max_green <= green) & (self.max_blue <= blue)
+
+    def id_sum(self, red: int, green: int, blue: int) -> int:
+        return int(self.game_no[self.possible(red, green, blue)].sum())
+
+    def power_sum(self) -> int:
+        return int((self.max_red * self.max_green * self.max_blue).sum())
+
+    def bag_index(self) -> "BagIndex":
+        return BagIndex(self)
+
+
+class BagIndex:
+    """
+    Sum of the numbers of the possible games for any bag, without a scan of the games.
+
+    Counts are small, so `table[red, green, blue]` holds the answer of every bag up
+    to the largest count of each color: the numbers of the games are added at their
+    (max_red, max_green, max_blue) cell, then summed cumulatively along each axis.
+    A larger bag is clamped to the table, a bag short of any color holds no game.
+    When the counts span more than `MAX_TABLE_CELLS`, queries scan the columns instead.
+    """
+
+    MAX_TABLE_CELLS = 16 * 1024 * 1024
+
+    def __init__(self, games: GameRecords) -> None:
+        self.games = games
+        self.shape = tuple(int(column.max(initial=0)) + 1
+                           for column in (games.max_red, games.max_green, games.max_blue))
+        self.table = None
+        if np.prod(self.shape, dtype=np.float64) <= self.MAX_TABLE_CELLS:
+            self.table = np.zeros(self.shape, dtype=np.int64)
+            np.add.at(self.table, (games.max_red, games.max_green, games.max_blue), games.game_no)
+            for axis in range(3):
+                np.cumsum(self.table, axis=axis, out=self.table)
+
+    def id_sum(self, red: int, green: int, blue: int) -> int:
+        return int(self.id_sums(np.array([[red, green, blue]]))[0])
+
+    def id_sums(self, bags: np.ndarray) -> np.ndarray:
+        """
+        Answer of every (red, green, blue) row of `bags`
+        """
+        bags = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+        if self.table is None:
+            return np.array([self.games.id_sum(*bag) for bag in bags], dtype=np.int64)
+
+        clamped = np.minimum(bags, np.array(self.shape) - 1)
+        sums = self.table[clamped[:, 0], clamped[:, 1], clamped[:, 2]]
+        return np.where((bags < 0).any(axis=1), 0, sums)
+
+
+def iter_batches(lines: Iterable[str], size: int = BATCH_LINES) -> Iterator[GameRecords]:
+    """
+    Records of `size` lines at a time, so a stream is parsed columnar in bounded memory
+    """
+    lines = iter(lines)
+    while batch := list(itertools.islice(lines, size)):
+        yield GameRecords.from_lines(batch)
+
+
+def _benchmark() -> None:
+    import random
+    import timeit
+
+    from aoc.generators import game_records
+
+    text = game_records(20000, random.Random(0))
+    lines = text.splitlines()
+    buffer = text.encode()
+    colors = ("red", "green", "blue")
+
+    def per_line() -> list[tuple[int, list[int]]]:
+        # The object and dict per game it replaced, minus the objects
+        games = []
+        for line in lines:
+            title, game = line.split(":")
+            counter = dict.fromkeys(colors, 0)
+            for round in game.split(";"):
+                for pick in round.split(","):
+                    num, ball = pick.split()
+                    counter[ball] = max(counter[ball], int(num))
+            games.append((int(title.split()[1]), list(counter.values())))
+        return games
+
+    per_line_s = min(timeit.repeat(per_line, number=1, repeat=3))
+    columnar_s = min(timeit.repeat(lambda: GameRecords.from_buffer(buffer), number=1, repeat=3))
+    print(f"{len(lines)} games  per line {per_line_s * 1000:.1f} ms  "
+          f"columnar {columnar_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    _benchmark()
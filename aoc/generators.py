@@ -0,0 +1,375 @@
+"""
+Synthetic puzzle inputs of any size
+
+Every generator takes a size and a seeded `random.Random` and returns the text
+of a valid input for its day, so solvers can be measured far beyond the size of
+the real inputs. What "size" means depends on the format:
+
+    day 1   calibration lines           day 7   hands
+    day 2   game records                day 8   nodes (at most ~44k, names are 3 characters)
+    day 3   side of the square grid     day 9   history rows
+    day 4   cards                       day 10  side of the square grid
+    day 5   range maps per layer        day 11  side of the square grid
+    day 6   races                       day 12  spring records
+
+Day 6 part 2 concatenates every race, so only small sizes stay within float range.
+`spring_rows` grows the groups of a fixed number of day 12 records instead.
+"""
+
+import random
+import string
+from typing import Callable
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+COLORS = ["red", "green", "blue"]
+SCHEMATIC_SYMBOLS = "*#+$/@%=&-"
+CARDS = "AKQJT98765432"
+ALMANAC_TITLES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+ALMANAC_SPACE = 2 ** 32
+# Ghost loop lengths of day 8 are multiples of the instruction length by these
+GHOST_PRIMES = [43, 47, 53, 59, 61, 67]
+NODE_CHARS = string.ascii_uppercase + string.digits
+# Records written by `spring_rows`, whatever their length
+SPRING_ROWS = 50
+
+Generator = Callable[[int, random.Random], str]
+
+
+def calibration_lines(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        tokens = [rng.choice(string.digits)]
+        for _ in range(rng.randint(2, 12)):
+            roll = rng.random()
+            if roll < 0.15:
+                tokens.append(rng.choice(string.digits))
+            elif roll < 0.35:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append(rng.choice(string.ascii_lowercase))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+
+    return "\n".join(lines) + "\n"
+
+
+def game_records(size: int, rng: random.Random) -> str:
+    lines = []
+    for game_no in range(1, size + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_no}: " + "; ".join(rounds))
+
+    return "\n".join(lines) + "\n"
+
+
+def schematic_grid(size: int, rng: random.Random) -> str:
+    rows = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            roll = rng.random()
+            n_digits = rng.randint(1, 3)
+            if roll < 0.12 and len(row) + n_digits < size:
+                row.extend(str(rng.randint(10 ** (n_digits - 1), 10 ** n_digits - 1)))
+                # Keep numbers on the same row apart
+                row.append(".")
+            elif roll < 0.18:
+                row.append(rng.choice(SCHEMATIC_SYMBOLS))
+            else:
+                row.append(".")
+        rows.append("".join(row[:size]))
+
+    return "\n".join(rows) + "\n"
+
+
+def scratchcards(size: int, rng: random.Random) -> str:
+    width = len(str(size))
+    lines = []
+    for card_no in range(1, size + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winners = numbers[:10]
+        # Cards never win copies past the end of the table
+        matches = min(int(rng.expovariate(0.4)), 10, size - card_no)
+        scratch = winners[:matches] + numbers[10:35 - matches]
+        rng.shuffle(scratch)
+
+        lines.append(f"Card {card_no:>{width}}: "
+                     + " ".join(f"{num:>2}" for num in winners)
+                     + " | "
+                     + " ".join(f"{num:>2}" for num in scratch))
+
+    return "\n".join(lines) + "\n"
+
+
+def almanac(size: int, rng: random.Random) -> str:
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(ALMANAC_SPACE // 2)
+        seeds += [start, rng.randint(1, ALMANAC_SPACE // 32)]
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+
+    for title in ALMANAC_TITLES:
+        # Source ranges of a layer never overlap
+        bounds = sorted(rng.sample(range(ALMANAC_SPACE), 2 * size))
+        lines = [f"{title} map:"]
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            range_len = end - start + 1
+            dest = rng.randrange(ALMANAC_SPACE - range_len)
+            lines.append(f"{dest} {start} {range_len}")
+        blocks.append("\n".join(lines))
+
+    return "\n\n".join(blocks) + "\n"
+
+
+def races(size: int, rng: random.Random) -> str:
+    times = [rng.randint(7, 100) for _ in range(size)]
+    # Every record can be beaten, the best distance is time ** 2 / 4
+    distances = [rng.randint(time * time // 8, time * time // 4 - 1) for time in times]
+
+    width = len(str(max(distances)))
+    return ("Time:     " + " ".join(f"{time:>{width}}" for time in times) + "\n"
+            + "Distance: " + " ".join(f"{dist:>{width}}" for dist in distances) + "\n")
+
+
+def camel_hands(size: int, rng: random.Random) -> str:
+    lines = ["".join(rng.choices(CARDS, k=5)) + f" {rng.randint(1, 1000)}"
+             for _ in range(size)]
+
+    return "\n".join(lines) + "\n"
+
+
+def node_graph(size: int, rng: random.Random) -> str:
+    """
+    One loop per ghost, walked from its `..A` node back into the loop right
+    after its `..Z` node. Loop lengths are multiples of the instruction
+    length, so the LCM of the first arrivals is the part 2 answer.
+    The first ghost starts at AAA and ends at ZZZ for part 1.
+    """
+    instruction_len = max(1, size // sum(GHOST_PRIMES))
+    instruction = "".join(rng.choices("LR", k=instruction_len))
+
+    # Names ending in A or Z are reserved for the ghosts' ends
+    middles = [a + b + c for a in NODE_CHARS for b in NODE_CHARS for c in NODE_CHARS
+               if c not in "AZ"]
+    n_middle = sum(instruction_len * prime - 1 for prime in GHOST_PRIMES)
+    if n_middle + 1 > len(middles):
+        raise ValueError(f"At most {len(middles)} nodes fit in 3 character names")
+    middles = iter(rng.sample(middles, n_middle + 1))
+    decoy = next(middles)
+
+    node_to_neighbor = {decoy: (decoy, decoy)}
+    for ghost, prime in enumerate(GHOST_PRIMES):
+        prefix = "AA" if ghost == 0 else f"{ghost}{ghost}"
+        loop = [prefix + "A"] + [next(middles) for _ in range(instruction_len * prime - 1)]
+        target = "ZZ" if ghost == 0 else prefix
+        loop.append(target + "Z")
+
+        for index, node in enumerate(loop[:-1]):
+            # Only the branch the instruction takes at this step stays on the loop
+            following = loop[index + 1]
+            if instruction[index % instruction_len] == "L":
+                node_to_neighbor[node] = (following, decoy)
+            else:
+                node_to_neighbor[node] = (decoy, following)
+        # The end node leads back to right after the start
+        following = loop[1]
+        node_to_neighbor[loop[-1]] = ((following, decoy) if instruction[0] == "L"
+                                      else (decoy, following))
+
+    nodes = list(node_to_neighbor)
+    rng.shuffle(nodes)
+    lines = [f"{node} = ({node_to_neighbor[node][0]}, {node_to_neighbor[node][1]})"
+             for node in nodes]
+
+    return instruction + "\n\n" + "\n".join(lines) + "\n"
+
+
+def history_rows(size: int, rng: random.Random) -> str:
+    """
+    Polynomials sampled at 21 points, the differences reach all zeroes
+    before they run out
+    """
+    length = 21
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        values = [sum(coef * x ** power for power, coef in enumerate(coefficients))
+                  for x in range(length)]
+        lines.append(" ".join(map(str, values)))
+
+    return "\n".join(lines) + "\n"
+
+
+def pipe_loop(size: int, rng: random.Random) -> str:
+    """
+    Grow a random tree of 3x3 blocks and trace the loop around it: every
+    block is a ring of pipes, and a tree edge opens the wall between two rings.
+    Block centers and opened walls end up enclosed, and junk pipes are
+    scattered over everything off the loop. A one tile margin keeps the start
+    off the border.
+    """
+    block = 3
+    k = (size - 2) // block
+    if k < 1:
+        raise ValueError(f"Pipe loops need a grid of at least {block + 2}x{block + 2}")
+
+    north, south, west, east = (-1, 0), (1, 0), (0, -1), (0, 1)
+    tile_of = {
+        frozenset((north, south)): "|",
+        frozenset((west, east)): "-",
+        frozenset((north, east)): "L",
+        frozenset((north, west)): "J",
+        frozenset((south, west)): "7",
+        frozenset((south, east)): "F",
+    }
+
+    # Randomized Prim's over about 60% of the k x k blocks
+    root = (rng.randrange(k), rng.randrange(k))
+    in_tree = {root}
+    frontier = [(root, (root[0] + dy, root[1] + dx))
+                for dy, dx in (north, south, west, east)]
+    tree_edges = []
+    while frontier and len(in_tree) < max(1, int(0.6 * k * k)):
+        parent, node = frontier.pop(rng.randrange(len(frontier)))
+        y, x = node
+        if not (0 <= y < k and 0 <= x < k) or node in in_tree:
+            continue
+        in_tree.add(node)
+        tree_edges.append((parent, node))
+        frontier += [(node, (y + dy, x + dx)) for dy, dx in (north, south, west, east)]
+
+    def origin(node: tuple[int, int]) -> tuple[int, int]:
+        return 1 + block * node[0], 1 + block * node[1]
+
+    # Every block starts as a ring of pipes around its center
+    links: dict[tuple[int, int], set[tuple[int, int]]] = {}
+    last = block - 1
+    for node in in_tree:
+        y, x = origin(node)
+        for i in range(1, last):
+            links[(y, x + i)] = {west, east}
+            links[(y + last, x + i)] = {west, east}
+            links[(y + i, x)] = {north, south}
+            links[(y + i, x + last)] = {north, south}
+        links[(y, x)] = {east, south}
+        links[(y, x + last)] = {west, south}
+        links[(y + last, x)] = {north, east}
+        links[(y + last, x + last)] = {north, west}
+
+    def reroute(tile: tuple[int, int], dropped: tuple[int, int], added: tuple[int, int]) -> None:
+        links[tile] = (links[tile] - {dropped}) | {added}
+
+    # A tree edge opens the shared wall, merging the two rings
+    for a, b in tree_edges:
+        a, b = sorted([a, b])
+        y, x = origin(a)
+        if a[0] == b[0]:  # b is east of a
+            reroute((y, x + last), south, east)
+            reroute((y + last, x + last), north, east)
+            reroute((y, x + block), south, west)
+            reroute((y + last, x + block), north, west)
+            for i in range(1, last):
+                del links[(y + i, x + last)]
+                del links[(y + i, x + block)]
+        else:  # b is south of a
+            reroute((y + last, x), east, south)
+            reroute((y + last, x + last), west, south)
+            reroute((y + block, x), east, north)
+            reroute((y + block, x + last), west, north)
+            for i in range(1, last):
+                del links[(y + last, x + i)]
+                del links[(y + block, x + i)]
+
+    grid = [["." for _ in range(size)] for _ in range(size)]
+    for (y, x), directions in links.items():
+        grid[y][x] = tile_of[frozenset(directions)]
+
+    start = rng.choice(sorted(links))
+    # Junk must not connect to the start, or its shape becomes ambiguous
+    near_start = {(start[0] + dy, start[1] + dx) for dy, dx in (north, south, west, east)}
+    junk = list(tile_of.values())
+    for y in range(size):
+        for x in range(size):
+            if (y, x) not in links and (y, x) not in near_start and rng.random() < 0.3:
+                grid[y][x] = rng.choice(junk)
+    grid[start[0]][start[1]] = "S"
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def galaxy_image(size: int, rng: random.Random) -> str:
+    density = 0.02
+    rows = ["".join("#" if rng.random() < density else "." for _ in range(size))
+            for _ in range(size)]
+
+    return "\n".join(rows) + "\n"
+
+
+def _spring_record(groups: list[int], rng: random.Random) -> str:
+    springs = "." * rng.randint(0, 2)
+    for index, group in enumerate(groups):
+        springs += "#" * group
+        springs += "." * rng.randint(1 if index < len(groups) - 1 else 0, 3)
+
+    # Hide a part of the springs
+    record = "".join("?" if rng.random() < 0.4 else spring for spring in springs)
+    return f"{record} {','.join(map(str, groups))}"
+
+
+def spring_records(size: int, rng: random.Random) -> str:
+    lines = [_spring_record([rng.randint(1, 5) for _ in range(rng.randint(1, 6))], rng)
+             for _ in range(size)]
+
+    return "\n".join(lines) + "\n"
+
+
+def spring_rows(size: int, rng: random.Random) -> str:
+    """
+    `SPRING_ROWS` spring records of `size` groups each, for growing the rows
+    rather than their number
+    """
+    lines = [_spring_record([rng.randint(1, 5) for _ in range(size)], rng)
+             for _ in range(SPRING_ROWS)]
+
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS: dict[int, Generator] = {
+    1: calibration_lines,
+    2: game_records,
+    3: schematic_grid,
+    4: scratchcards,
+    5: almanac,
+    6: races,
+    7: camel_hands,
+    8: node_graph,
+    9: history_rows,
+    10: pipe_loop,
+    11: galaxy_image,
+    12: spring_records,
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for day {day}")
+
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def write_input(day: int, size: int, output_file: str, seed: int = 0) -> str:
+    with open(output_file, "w") as f:
+        f.write(generate(day, size, seed))
+
+    return output_file
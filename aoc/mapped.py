@@ -0,0 +1,109 @@
+"""
+Memory-mapped, zero-copy access to puzzle inputs
+
+The file is mapped instead of read, and lines are handed out lazily as
+`memoryview` slices of the mapping, so no copy of the whole file ever exists
+as Python objects. Views must be released before the mapping is closed.
+"""
+
+import mmap
+from typing import Iterator, Optional
+
+from aoc import tracing
+
+NEWLINE = b"\n"
+CARRIAGE_RETURN = ord("\r")
+
+
+class MappedInput:
+
+    def __init__(self, input_file: str) -> None:
+        with tracing.span("read.mmap", input=input_file):
+            self._file = open(input_file, "rb")
+            self._mmap: Optional[mmap.mmap] = None
+            try:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # an empty file can't be mapped
+                pass
+        self._buffer = self._mmap if self._mmap is not None else b""
+        self._view = memoryview(self._buffer)
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __getitem__(self, index: slice) -> bytes:
+        return self._buffer[index]
+
+    @property
+    def view(self) -> memoryview:
+        return self._view
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        return self._buffer.find(sub, start)
+
+    def line_spans(self,
+                   start: int = 0,
+                   stop: Optional[int] = None) -> Iterator[tuple[int, int]]:
+        """
+        (start, end) offsets of every line starting in [start, stop), without the line ending
+        """
+        size = len(self._buffer)
+        if stop is not None:
+            size = min(size, stop)
+        while start < size:
+            newline = self._buffer.find(NEWLINE, start)
+            next_start = len(self._buffer) if newline == -1 else newline + 1
+            end = len(self._buffer) if newline == -1 else newline
+            if end > start and self._buffer[end - 1] == CARRIAGE_RETURN:
+                end -= 1
+
+            yield start, end
+            start = next_start
+
+    def lines(self) -> Iterator[memoryview]:
+        for start, end in self.line_spans():
+            yield self._view[start:end]
+
+    @property
+    def stride(self) -> int:
+        """
+        Bytes per row of a fixed-width grid, line ending included
+        """
+        newline = self._buffer.find(NEWLINE)
+        return len(self._buffer) if newline == -1 else newline + 1
+
+    def coordinates(self, offset: int) -> tuple[int, int]:
+        """
+        (y, x) of a byte offset in a fixed-width grid
+        """
+        return divmod(offset, self.stride)
+
+
+def iter_lines(input_file: str,
+               start: int = 0,
+               stop: Optional[int] = None) -> Iterator[str]:
+    """
+    Decode one line at a time, the mapping is closed once exhausted
+    """
+    with MappedInput(input_file) as mapped:
+        for line_start, line_end in mapped.line_spans(start, stop):
+            yield str(mapped[line_start:line_end], "utf-8")
+
+
+def read_rows(input_file: str) -> list[str]:
+    """
+    Every line decoded, for solvers that need random access to rows
+    """
+    return list(iter_lines(input_file))
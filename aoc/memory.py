@@ -0,0 +1,90 @@
+"""
+Memory used by the parse and solve phases of a solver, traced with tracemalloc
+
+Tracing slows Python down several times over, so memory is always measured
+on a run of its own, never on a timed one.
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Optional
+
+from aoc import parse_cache, registry
+
+
+@dataclass
+class PhaseMemory:
+    """
+    peak_bytes: highest traced memory above what was live when the phase started
+    retained_bytes: still alive once the phase is over, e.g. the parsed input
+    net_blocks: memory blocks still allocated after the phase minus before it,
+        blocks allocated and freed within the phase cancel out
+    """
+    peak_bytes: int
+    retained_bytes: int
+    net_blocks: int
+
+    def __str__(self) -> str:
+        return (f"peak {self.peak_bytes / 1024:.1f} KiB, "
+                f"retained {self.retained_bytes / 1024:.1f} KiB, "
+                f"{self.net_blocks:+} net blocks")
+
+
+@dataclass
+class SolverMemory:
+    parse: PhaseMemory
+    solve: PhaseMemory
+
+    @property
+    def peak_bytes(self) -> int:
+        """
+        Overall peak, the parsed input is still alive while solving
+        """
+        return max(self.parse.peak_bytes,
+                   self.parse.retained_bytes + self.solve.peak_bytes)
+
+
+def _checkpoint() -> tuple[int, int]:
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    return current, sys.getallocatedblocks()
+
+
+def _phase_since(start: tuple[int, int]) -> PhaseMemory:
+    start_bytes, start_blocks = start
+    current, peak = tracemalloc.get_traced_memory()
+
+    return PhaseMemory(peak_bytes=peak - start_bytes,
+                       retained_bytes=current - start_bytes,
+                       net_blocks=sys.getallocatedblocks() - start_blocks)
+
+
+def measure(module: ModuleType,
+            input_file: Optional[str] = None) -> tuple[SolverMemory, Any]:
+    """
+    (memory of each phase, answer), parsing for real rather than from the parse cache
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        with parse_cache.disabled():
+            start = _checkpoint()
+            parsed = registry.parse_input(module, input_file)
+            parse = _phase_since(start)
+
+            start = _checkpoint()
+            answer = registry.run_solver(module, parsed)
+            solve = _phase_since(start)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return SolverMemory(parse=parse, solve=solve), answer
+
+
+def format_memory(solver_memory: SolverMemory) -> str:
+    return (f"parse: {solver_memory.parse}\n"
+            f"solve: {solver_memory.solve}")
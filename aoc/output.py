@@ -0,0 +1,85 @@
+"""
+Shared output layer: answers on stdout, leveled logging on stderr
+
+`rich` costs tens of milliseconds to import, so it's only imported the first
+time something is pretty printed, and only when stderr is a terminal.
+Hot loops guard their debug lines with the module level flag, so a disabled
+line doesn't even build its message:
+
+    if output.DEBUG:
+        output.debug(f"Card {card_no}, {card_stat}")
+
+The level comes from `AOC_LOG` (debug, info, warning or quiet, default info)
+and can be changed at runtime with `set_level()`.
+"""
+
+import os
+import sys
+from typing import Any
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "quiet": 100}
+
+
+
+def _env_level() -> int:
+    name = os.environ.get("AOC_LOG", "info").lower()
+    if name not in LEVELS:
+        print(f"Unknown AOC_LOG level {name!r}, logging at info", file=sys.stderr)
+        name = "info"
+    return LEVELS[name]
+
+
+LEVEL = _env_level()
+DEBUG = LEVEL <= LEVELS["debug"]
+
+_console = None
+
+
+def set_level(name: str) -> None:
+    global LEVEL, DEBUG
+    LEVEL = LEVELS[name]
+    DEBUG = LEVEL <= LEVELS["debug"]
+
+
+def _pretty_print(*objects: Any) -> None:
+    global _console
+    if _console is None:
+        try:
+            from rich.console import Console
+        except ImportError:
+            _console = False
+        else:
+            _console = Console(stderr=True)
+
+    if _console:
+        _console.print(*objects)
+    else:
+        print(*objects, file=sys.stderr)
+
+
+def _log(level: int, *objects: Any) -> None:
+    if level < LEVEL:
+        return
+    if sys.stderr.isatty():
+        _pretty_print(*objects)
+    else:
+        print(*objects, file=sys.stderr)
+
+
+def debug(*objects: Any) -> None:
+    _log(LEVELS["debug"], *objects)
+
+
+def info(*objects: Any) -> None:
+    _log(LEVELS["info"], *objects)
+
+
+def warning(*objects: Any) -> None:
+    _log(LEVELS["warning"], *objects)
+
+
+def answer(value: Any) -> None:
+    """
+    Answers are plain text on stdout, whatever the level, so they can be piped
+    """
+    print(value)
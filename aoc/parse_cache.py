@@ -0,0 +1,217 @@
+"""
+On-disk cache of parsed inputs
+
+Entries are pickled and keyed by the solver module, a parser version and the
+hash of the input file's content, so an unchanged input skips parsing entirely.
+Bump the version passed to `cached()` whenever the parsed structure changes;
+entries of other versions are evicted on the next store, and the cache is kept
+under `MAX_CACHE_BYTES` by evicting the least recently used entries.
+Long-running processes (the solver daemon) also keep recent entries pickled in
+memory, up to `MAX_MEMORY_BYTES`, so a warm hit doesn't touch the disk.
+
+Set `AOC_PARSE_CACHE=0` to disable it and `AOC_CACHE_DIR` to move it; it is
+also bypassed while tracing.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from aoc import tracing
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", ".aoc_cache")) / "parsed"
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+MAX_MEMORY_BYTES = 64 * 1024 * 1024
+ENABLED = os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+
+ProcessInput = Callable[..., Any]
+
+# Entry path -> pickled entry, kept pickled so every hit hands out a fresh copy
+# that solvers are free to mutate
+_memory: OrderedDict[Path, bytes] = OrderedDict()
+_memory_bytes = 0
+_memory_lock = threading.Lock()
+
+# Parsers whose entries of other versions this process already dropped
+_swept: set[tuple[str, int]] = set()
+
+
+class SizeCap:
+    """
+    Running size of the entries of a cache directory, so a store doesn't glob and
+    stat every entry: the directory is scanned on the first store of a process,
+    then only when the running total goes over `max_bytes`, to evict the least
+    recently used entries. Other processes' stores are caught up on by that scan.
+    """
+
+    def __init__(self, directory: Path, pattern: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.pattern = pattern
+        self.max_bytes = max_bytes
+        self.total: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.total = None
+
+    def add(self, size: int) -> None:
+        with self._lock:
+            if self.total is None:
+                self.total = self._evict()
+            else:
+                self.total += size
+                if self.total > self.max_bytes:
+                    self.total = self._evict()
+
+    def _evict(self) -> int:
+        """
+        Drop the least recently used entries over the cap, returns the size left
+        """
+        entries = []
+        for path in self.directory.glob(self.pattern):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted by a concurrent run
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        return total
+
+
+_disk = SizeCap(CACHE_DIR, "*.pickle", MAX_CACHE_BYTES)
+
+
+@contextmanager
+def disabled() -> Iterator[None]:
+    """
+    Parse for real within the block, for measurements of the parse phase
+    """
+    global ENABLED
+    was_enabled = ENABLED
+    ENABLED = False
+    try:
+        yield
+    finally:
+        ENABLED = was_enabled
+
+
+def file_digest(input_file: str) -> str:
+    with open(input_file, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()[:32]
+
+
+def _entry_path(name: str, version: int, digest: str) -> Path:
+    return CACHE_DIR / f"{name}-v{version}-{digest}.pickle"
+
+
+def load(name: str, version: int, digest: str) -> tuple[bool, Any]:
+    """
+    (hit, parsed); unreadable entries, e.g. pickled from a `__main__` run, are misses
+    """
+    path = _entry_path(name, version, digest)
+    with _memory_lock:
+        blob = _memory.get(path)
+        if blob is not None:
+            _memory.move_to_end(path)
+    if blob is not None:
+        return True, pickle.loads(blob)
+
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        parsed = pickle.loads(blob)
+    except Exception:
+        return False, None
+
+    # Recently used entries are the last to be evicted
+    os.utime(path)
+    _remember(path, blob)
+    return True, parsed
+
+
+def _remember(path: Path, blob: bytes) -> None:
+    global _memory_bytes
+    with _memory_lock:
+        _memory_bytes += len(blob) - len(_memory.get(path, b""))
+        _memory[path] = blob
+        _memory.move_to_end(path)
+
+        while _memory_bytes > MAX_MEMORY_BYTES and _memory:
+            _, evicted = _memory.popitem(last=False)
+            _memory_bytes -= len(evicted)
+
+
+def store(name: str, version: int, digest: str, parsed: Any) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _entry_path(name, version, digest)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        blob = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+    with open(tmp_path, "wb") as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+    _remember(path, blob)
+
+    if (name, version) not in _swept:
+        evict_versions(name, version)
+    _disk.add(len(blob))
+
+
+def evict_versions(name: str, version: int) -> None:
+    """
+    Drop the entries of other versions of this parser, once per process
+    """
+    for path in CACHE_DIR.glob(f"{name}-v*.pickle"):
+        entry_name, entry_version, _ = path.stem.rsplit("-", 2)
+        if entry_name == name and entry_version != f"v{version}":
+            path.unlink(missing_ok=True)
+
+    _swept.add((name, version))
+    _disk.reset()
+
+
+def cached(version: int) -> Callable[[ProcessInput], ProcessInput]:
+    """
+    Decorate a `process_input(input_file)` whose result is picklable
+    """
+    def decorator(process_input: ProcessInput) -> ProcessInput:
+        name = Path(inspect.getfile(process_input)).stem
+        default_input_file = inspect.signature(process_input).parameters["input_file"].default
+
+        @functools.wraps(process_input)
+        def wrapper(input_file: Optional[str] = None) -> Any:
+            if input_file is None:
+                input_file = default_input_file
+            # A trace is there to show the parse, not a pickle load
+            if not ENABLED or tracing.ENABLED:
+                return process_input(input_file)
+
+            digest = file_digest(input_file)
+            hit, parsed = load(name, version, digest)
+            if hit:
+                return parsed
+
+            parsed = process_input(input_file)
+            store(name, version, digest, parsed)
+            return parsed
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,131 @@
+"""
+Hot-path counters and timers for solvers, plus cProfile dumps for the runner
+
+Counters are disabled by default and then cost nothing: the decorators hand
+back the undecorated function, so enable them (`AOC_PROFILE=1` or `enable()`)
+before the solver module is imported. Inline counts should be guarded:
+
+    if profiling.ENABLED:
+        profiling.count("range splits")
+"""
+
+import cProfile
+import functools
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+ENABLED = os.environ.get("AOC_PROFILE", "0") == "1"
+
+_counts: Counter[str] = Counter()
+_times: defaultdict[str, float] = defaultdict(float)
+_depths: Counter[str] = Counter()
+
+
+def enable() -> None:
+    global ENABLED
+    ENABLED = True
+
+
+def reset() -> None:
+    _counts.clear()
+    _times.clear()
+    _depths.clear()
+
+
+def count(name: str, n: int = 1) -> None:
+    _counts[name] += n
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    if not ENABLED:
+        yield
+        return
+
+    _counts[name] += 1
+    _depths[name] += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _depths[name] -= 1
+        # Recursive calls are only timed at the outermost call
+        if _depths[name] == 0:
+            _times[name] += time.perf_counter() - start
+
+
+def counted(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Count calls of the decorated function
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            _counts[label] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def timed(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Count calls of the decorated function and time them
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot() -> dict[str, tuple[int, float]]:
+    """
+    name -> (count, total ms)
+    """
+    return {name: (n, _times.get(name, 0.0) * 1000)
+            for name, n in sorted(_counts.items())}
+
+
+def format_summary(stats: dict[str, tuple[int, float]]) -> str:
+    if not stats:
+        return "No counters hit"
+
+    width = max(len(name) for name in stats) + 2
+    rows = [f"{'counter':<{width}}{'count':>12}{'total ms':>12}"]
+    for name, (n, total_ms) in stats.items():
+        rows.append(f"{name:<{width}}{n:>12}{total_ms:>12.2f}")
+
+    return "\n".join(rows)
+
+
+def dump_path(profile_dir: str, label: str) -> str:
+    os.makedirs(profile_dir, exist_ok=True)
+    return os.path.join(profile_dir, f"{label}.pstats")
+
+
+def profile_call(func: Callable[[], Any], dump_file: str) -> Any:
+    """
+    Run `func` under cProfile and dump the pstats to `dump_file`
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        profiler.dump_stats(dump_file)
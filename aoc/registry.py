@@ -0,0 +1,220 @@
+"""
+Registry of every (day, part) solver
+
+Solver modules are only imported on demand, so running a single day
+doesn't pay for the imports of the other 24 modules.
+"""
+
+import importlib
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable, Iterator, Optional
+
+from aoc import result_cache, tracing
+from aoc.mapped import iter_lines
+
+# Solvers like day 10 recurse along the whole loop
+RECURSION_LIMIT = 200000
+
+# Input path meaning "read from stdin"
+STDIN = "-"
+
+# The solver module of a pool worker process, imported once by `init_worker`
+_worker_module: Optional[ModuleType] = None
+
+SOLVER_MODULES = {
+    (1, 1): "day01_trebuchet",
+    (1, 2): "day01_trebuchet_part2",
+    (2, 1): "day02_cube_conundrum",
+    (2, 2): "day02_cube_conundrum_part2",
+    (3, 1): "day03_gear_ratio",
+    (3, 2): "day03_gear_ratio_part2",
+    (4, 1): "day04_scratchcards",
+    (4, 2): "day04_scratchcards_part2",
+    (5, 1): "day05_if_you_give_a_seed_a_fertilizer",
+    (5, 2): "day05_if_you_give_a_seed_a_fertilizer_part2",
+    (6, 1): "day06_wait_for_it",
+    (6, 2): "day06_wait_for_it_part2",
+    (7, 1): "day07_camel_cards",
+    (7, 2): "day07_camel_cards_part2",
+    (8, 1): "day08_haunted_wasteland",
+    (8, 2): "day08_haunted_wasteland_part2",
+    (9, 1): "day09_mirage_maintenance",
+    (9, 2): "day09_mirage_maintenance_part2",
+    (10, 1): "day10_pipe_maze",
+    (10, 2): "day10_pipe_maze_part2",
+    (11, 1): "day11_cosmic_expansion",
+    (11, 2): "day11_cosmic_expansion_part2",
+    (12, 1): "day12_hot_springs",
+    (12, 2): "day12_hot_springs_part2v2",
+}
+
+
+def label(day: int, part: int) -> str:
+    return f"day{day:02d}-part{part}"
+
+
+def select(day: Optional[int] = None,
+           part: Optional[int] = None) -> list[tuple[int, int]]:
+    """
+    Registered (day, part) keys in order, optionally filtered
+    """
+    return [(_day, _part) for _day, _part in sorted(SOLVER_MODULES)
+            if (day is None or _day == day) and (part is None or _part == part)]
+
+
+def load_module(day: int, part: int) -> ModuleType:
+    key = (day, part)
+    if key not in SOLVER_MODULES:
+        raise ValueError(f"No solver registered for day {day} part {part}")
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), RECURSION_LIMIT))
+    return importlib.import_module(SOLVER_MODULES[key])
+
+
+def init_worker(day: int, part: int) -> None:
+    """
+    Process pool initializer, so each worker imports its solver once
+    """
+    global _worker_module
+    _worker_module = load_module(day, part)
+
+
+def worker_module() -> ModuleType:
+    """
+    The solver module `init_worker` imported in this worker process
+    """
+    if _worker_module is None:
+        raise RuntimeError("No solver imported, init_worker didn't run in this process")
+
+    return _worker_module
+
+
+def get_solver(module: ModuleType) -> Callable[..., Any]:
+    """
+    Either a module level `solve()` or `Solution().solve`
+    """
+    if hasattr(module, "Solution"):
+        return module.Solution().solve
+
+    return module.solve
+
+
+def parse_input(module: ModuleType,
+                input_file: Optional[str] = None) -> Any:
+    if input_file is None:
+        input_file = module.INPUT_FILE
+
+    with tracing.span("parse", solver=module.__name__, input=input_file):
+        return module.process_input(input_file)
+
+
+def run_solver(module: ModuleType,
+               parsed: Any) -> Any:
+    """
+    Same calling convention as each module's `main()`:
+    tuples are unpacked into positional arguments
+    """
+    solver = get_solver(module)
+    with tracing.span("solve", solver=module.__name__):
+        if isinstance(parsed, tuple):
+            return solver(*parsed)
+
+        return solver(parsed)
+
+
+def solve(day: int,
+          part: int,
+          input_file: Optional[str] = None) -> Any:
+    module = load_module(day, part)
+
+    return run_solver(module, parse_input(module, input_file))
+
+
+def solve_memoized(day: int,
+                   part: int,
+                   input_file: Optional[str] = None) -> Any:
+    """
+    `solve()` through the on-disk memo of answers
+    """
+    module = load_module(day, part)
+    entry = result_cache.key(module, input_file)
+    hit, answer = result_cache.load(entry)
+    if not hit:
+        answer = run_solver(module, parse_input(module, input_file))
+        result_cache.store(entry, answer)
+
+    return answer
+
+
+def run_timed(module: ModuleType,
+              input_file: Optional[str] = None) -> tuple[Any, float, float]:
+    """
+    (answer, parse ms, solve ms)
+    """
+    start = time.perf_counter()
+    parsed = parse_input(module, input_file)
+    parsed_at = time.perf_counter()
+    answer = run_solver(module, parsed)
+    solved_at = time.perf_counter()
+
+    return answer, (parsed_at - start) * 1000, (solved_at - parsed_at) * 1000
+
+
+def run_memoized(module: ModuleType,
+                 input_file: Optional[str] = None) -> tuple[Any, float, float, bool]:
+    """
+    (answer, parse ms, solve ms, hit), a memoized answer takes no parse nor solve
+    """
+    entry = result_cache.key(module, input_file)
+    hit, answer = result_cache.load(entry)
+    if hit:
+        return answer, 0.0, 0.0, True
+
+    answer, parse_ms, solve_ms = run_timed(module, input_file)
+    result_cache.store(entry, answer)
+    return answer, parse_ms, solve_ms, False
+
+
+def stream_lines(module: ModuleType,
+                 input_file: Optional[str] = None) -> Iterator[str]:
+    """
+    Non-blank lines without their line ending, one at a time
+    """
+    if input_file is None:
+        input_file = module.INPUT_FILE
+    lines = sys.stdin if input_file == STDIN else iter_lines(input_file)
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line.strip():
+            yield line
+
+
+def solve_stream(day: int,
+                 part: int,
+                 input_file: Optional[str] = None) -> Any:
+    """
+    Constant memory solve for the days providing a `solve_stream(lines)`
+    """
+    module = load_module(day, part)
+    if not hasattr(module, "solve_stream"):
+        raise ValueError(f"Day {day} part {part} has no streaming mode")
+
+    return module.solve_stream(stream_lines(module, input_file))
+
+
+def solve_vectorized(day: int,
+                     part: int,
+                     input_file: Optional[str] = None) -> Any:
+    """
+    Whole-buffer NumPy solve for the days providing a `solve_vectorized(input_file)`
+    """
+    module = load_module(day, part)
+    if not hasattr(module, "solve_vectorized"):
+        raise ValueError(f"Day {day} part {part} has no vectorized mode")
+    if input_file is None:
+        input_file = module.INPUT_FILE
+
+    return module.solve_vectorized(input_file)
@@ -0,0 +1,152 @@
+"""
+On-disk memo of answers, keyed by the solver's source and the input's content
+
+An unchanged solver on an unchanged input answers without parsing or solving.
+The source hash covers the solver module and every `aoc` module it reaches
+through its globals (`aoc.digit_scan`, `aoc.integers`...), so editing
+any of them means its old entries are never hit again and are evicted on the
+next store; the memo is kept under
+`MAX_CACHE_BYTES` by evicting the least recently used entries, tracked with a
+running total rather than a scan of the directory on every store.
+
+Set `AOC_RESULT_CACHE=0` to disable it and `AOC_CACHE_DIR` to move it.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional
+
+from aoc.parse_cache import SizeCap, file_digest
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", ".aoc_cache")) / "results"
+MAX_CACHE_BYTES = 16 * 1024 * 1024
+ENABLED = os.environ.get("AOC_RESULT_CACHE", "1") != "0"
+
+# Solver modules are the day*.py files at the root of the repository, and the shared code
+# they use lives in aoc/; anything else, like a virtualenv in the repository, is not hashed
+ROOT = Path(__file__).resolve().parent.parent
+SHARED_DIR = ROOT / "aoc"
+
+# Source file -> (mtime, digest), so a long-running process hashes each source once per edit
+_source_digests: dict[str, tuple[int, str]] = {}
+# Solver name -> the repository modules it depends on, itself included
+_dependencies: dict[str, list[ModuleType]] = {}
+
+# (solver, source digest) whose entries of older sources this process already dropped
+_swept: set[tuple[str, str]] = set()
+
+_disk = SizeCap(CACHE_DIR, "*.json", MAX_CACHE_BYTES)
+
+
+def _file_digest(source_file: str) -> str:
+    mtime = os.stat(source_file).st_mtime_ns
+    if source_file not in _source_digests or _source_digests[source_file][0] != mtime:
+        _source_digests[source_file] = (mtime, file_digest(source_file))
+
+    return _source_digests[source_file][1]
+
+
+def _is_local(module: ModuleType) -> bool:
+    source_file = getattr(module, "__file__", None)
+    if source_file is None:
+        return False
+
+    path = Path(source_file).resolve()
+    return (path.parent == ROOT and path.name.startswith("day")) or path.is_relative_to(SHARED_DIR)
+
+
+def dependencies(module: ModuleType) -> list[ModuleType]:
+    """
+    The module and every repository module reachable from its globals, imported
+    modules as well as the modules of imported functions and classes
+    """
+    if module.__name__ not in _dependencies:
+        found = {module.__name__: module}
+        pending = [module]
+        while pending:
+            for value in vars(pending.pop()).values():
+                if isinstance(value, ModuleType):
+                    dependency = value
+                else:
+                    module_name = getattr(value, "__module__", None)
+                    dependency = sys.modules.get(module_name) if isinstance(module_name, str) else None
+                if dependency is None or dependency.__name__ in found or not _is_local(dependency):
+                    continue
+                found[dependency.__name__] = dependency
+                pending.append(dependency)
+        _dependencies[module.__name__] = sorted(found.values(), key=lambda found_module: found_module.__name__)
+
+    return _dependencies[module.__name__]
+
+
+def source_digest(module: ModuleType) -> str:
+    digests = "\n".join(f"{dependency.__name__} {_file_digest(dependency.__file__)}"
+                         for dependency in dependencies(module))
+    return hashlib.blake2b(digests.encode()).hexdigest()[:32]
+
+
+def key(module: ModuleType, input_file: Optional[str] = None) -> Optional[Path]:
+    """
+    Entry path of this solver on this input, None when the memo is disabled
+    """
+    if not ENABLED:
+        return None
+    if input_file is None:
+        input_file = module.INPUT_FILE
+
+    name = module.__name__
+    return CACHE_DIR / f"{name}-{source_digest(module)}-{file_digest(input_file)}.json"
+
+
+def load(path: Optional[Path]) -> tuple[bool, Any]:
+    """
+    (hit, answer)
+    """
+    if path is None:
+        return False, None
+    try:
+        with open(path, "r") as f:
+            answer = json.load(f)
+    except (OSError, ValueError):
+        return False, None
+
+    # Recently used entries are the last to be evicted
+    os.utime(path)
+    return True, answer
+
+
+def store(path: Optional[Path], answer: Any) -> None:
+    if path is None:
+        return
+    try:
+        blob = json.dumps(answer)
+    except (TypeError, ValueError):  # only plain answers are memoized
+        return
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+
+    name, source, _ = path.stem.rsplit("-", 2)
+    if (name, source) not in _swept:
+        evict_sources(name, source)
+    _disk.add(len(blob))
+
+
+def evict_sources(name: str, source: str) -> None:
+    """
+    Drop the entries of older sources of this solver, once per process
+    """
+    for entry in CACHE_DIR.glob(f"{name}-*.json"):
+        entry_name, entry_source, _ = entry.stem.rsplit("-", 2)
+        if entry_name == name and entry_source != source:
+            entry.unlink(missing_ok=True)
+
+    _swept.add((name, source))
+    _disk.reset()
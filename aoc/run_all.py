@@ -0,0 +1,117 @@
+"""
+Solve every registered day/part concurrently on a process pool
+
+Each task reports as soon as it finishes, so a slow solver doesn't hold back
+the others, and the final results are returned in registry order.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+from aoc import memory, profiling, registry, tracing
+
+
+@dataclass
+class TaskResult:
+    day: int
+    part: int
+    answer: Any
+    wall_ms: float
+    error: Optional[str] = None
+    # Answered by the result memo, the wall time then covers no parse nor solve
+    cached: bool = False
+    counters: dict[str, tuple[int, float]] = field(default_factory=dict)
+    memory_usage: Optional[memory.SolverMemory] = None
+    trace_events: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        return registry.label(self.day, self.part)
+
+    def __str__(self) -> str:
+        outcome = f"error: {self.error}" if self.error else self.answer
+        cached = "  (cached)" if self.cached else ""
+        return f"{self.label:<14}{self.wall_ms:>10.1f} ms  {outcome}{cached}"
+
+
+def _solve_task(day: int,
+                part: int,
+                profile_dir: Optional[str] = None,
+                trace_memory: bool = False,
+                trace: bool = False,
+                use_cache: bool = True) -> TaskResult:
+    """
+    Runs inside a worker process, failures are reported instead of raised
+    so one broken solver doesn't take down the whole run.
+    Memory is traced on a second run, so the wall time stays untraced.
+    Profiled and traced runs always solve, bypassing the result memo.
+    """
+    if profile_dir is not None:
+        profiling.enable()
+        profiling.reset()
+    if trace:
+        tracing.enable()
+        tracing.reset()
+        tracing.name_process(f"worker {os.getpid()}")
+
+    hit = False
+    start = time.perf_counter()
+    try:
+        with tracing.span(registry.label(day, part)):
+            if use_cache and profile_dir is None and not trace:
+                answer, _, _, hit = registry.run_memoized(registry.load_module(day, part))
+            elif profile_dir is None:
+                answer = registry.solve(day, part)
+            else:
+                dump_file = profiling.dump_path(profile_dir, registry.label(day, part))
+                answer = profiling.profile_call(lambda: registry.solve(day, part), dump_file)
+        error = None
+    except Exception as e:
+        answer = None
+        error = repr(e)
+    wall_ms = (time.perf_counter() - start) * 1000
+    trace_events = tracing.events()
+
+    solver_memory = None
+    if trace_memory and error is None:
+        solver_memory, _ = memory.measure(registry.load_module(day, part))
+
+    return TaskResult(day=day,
+                      part=part,
+                      answer=answer,
+                      wall_ms=wall_ms,
+                      error=error,
+                      cached=hit,
+                      counters=profiling.snapshot(),
+                      memory_usage=solver_memory,
+                      trace_events=trace_events)
+
+
+def run_all(keys: Iterable[tuple[int, int]],
+            max_workers: Optional[int] = None,
+            on_result: Optional[Callable[[TaskResult], None]] = None,
+            profile_dir: Optional[str] = None,
+            trace_memory: bool = False,
+            trace: bool = False,
+            use_cache: bool = True) -> list[TaskResult]:
+    keys = list(keys)
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        future_to_key = {executor.submit(_solve_task, day, part,
+                                         profile_dir, trace_memory, trace, use_cache): (day, part)
+                         for day, part in keys}
+        for future in as_completed(future_to_key):
+            result = future.result()
+            results[future_to_key[future]] = result
+            if on_result is not None:
+                on_result(result)
+
+    return [results[key] for key in keys]
+
+
+def report_progress(result: TaskResult) -> None:
+    print(f"done {result}", file=sys.stderr, flush=True)
@@ -0,0 +1,70 @@
+"""
+Number spans of a day 3 engine schematic, shared by both parts
+
+One pass over the rows finds every number once, with its span and value, and
+labels every cell it covers with the number's id. The label grid has a border
+of empty cells, so the numbers around a symbol are the labels of its 3x3
+neighborhood, read without bounds checks nor walking along the digits again.
+
+Which characters are symbols is a regex character class, `SYMBOLS` by default,
+e.g. `r"[^\d.]"` for anything but digits and periods. `SchematicMasks`, in
+`aoc.schematic_masks`, does the same with NumPy arrays for large schematics.
+"""
+
+import re
+
+# Characters counted as symbols, periods and digits never are
+SYMBOLS = "[" + re.escape(r"""`~!@#$%^&*()_-+={[}}|\:;"'<,>?/""") + "]"
+
+NUMBER = re.compile(r"\d+")
+NO_NUMBER = -1
+
+
+class Schematic:
+
+    def __init__(self, rows: list[str], symbols: str = SYMBOLS) -> None:
+        self.rows = rows
+        self.height = len(rows)
+        self.width = max(map(len, rows), default=0)
+        # Padded by one cell on each side
+        self.stride = self.width + 2
+
+        self.spans: list[tuple[int, int, int]] = []
+        self.values: list[int] = []
+        self.labels = [NO_NUMBER] * self.stride
+        symbol_pattern = re.compile(symbols)
+        self.symbols: list[tuple[int, int]] = []
+
+        for y, row in enumerate(rows):
+            row_labels = [NO_NUMBER] * self.stride
+            for match in NUMBER.finditer(row):
+                start, end = match.span()
+                row_labels[start + 1: end + 1] = [len(self.values)] * (end - start)
+                self.spans.append((y, start, end))
+                self.values.append(int(match.group()))
+            self.labels += row_labels
+            self.symbols += [(y, match.start()) for match in symbol_pattern.finditer(row)]
+        self.labels += [NO_NUMBER] * self.stride
+
+    def adjacent_numbers(self, y: int, x: int) -> set[int]:
+        """
+        Ids of the numbers touching cell (y, x), diagonally included
+        """
+        labels = self.labels
+        center = (y + 1) * self.stride + x + 1
+        adjacent = set()
+        for row_start in (center - self.stride - 1, center - 1, center + self.stride - 1):
+            adjacent.update(labels[row_start: row_start + 3])
+        adjacent.discard(NO_NUMBER)
+
+        return adjacent
+
+    def part_numbers(self) -> set[int]:
+        """
+        Ids of the numbers touching any symbol
+        """
+        part_numbers = set()
+        for y, x in self.symbols:
+            part_numbers |= self.adjacent_numbers(y, x)
+
+        return part_numbers
@@ -0,0 +1,105 @@
+"""
+Day 3 engine schematics as NumPy arrays, for large schematics
+
+The grid is read as a 2-D uint8 array and its digit runs are labeled with the
+id of their number. A symbol mask dilated over the 3x3 neighborhood selects the
+part numbers among the labeled runs, and the gears come from the sorted labels
+around each symbol. Answers are the same as `aoc.schematic.Schematic`'s.
+"""
+
+import re
+from typing import Union
+
+import numpy as np
+
+from aoc.integers import digit_runs
+from aoc.schematic import NO_NUMBER, SYMBOLS
+
+PERIOD = ord(".")
+ZERO = ord("0")
+NINE = ord("9")
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+NEIGHBORHOOD = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+
+
+def symbol_table(symbols: str = SYMBOLS) -> np.ndarray:
+    """
+    Whether each byte value is in the `symbols` character class
+    """
+    pattern = re.compile(symbols)
+    return np.array([bool(pattern.fullmatch(chr(byte))) for byte in range(256)])
+
+
+def read_grid(buffer: Union[bytes, np.ndarray]) -> np.ndarray:
+    """
+    Rows of bytes as a 2-D uint8 array, shorter rows padded with periods
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8) if not isinstance(buffer, np.ndarray) else buffer
+    newlines = np.flatnonzero(data == NEWLINE)
+    if len(newlines) and data[-1] != NEWLINE:
+        data = np.concatenate((data, np.array([NEWLINE], dtype=np.uint8)))
+        newlines = np.append(newlines, len(data) - 1)
+
+    # Equal rows, the usual case, are a reshape of the buffer
+    stride = newlines[0] + 1 if len(newlines) else 0
+    if stride and len(data) % stride == 0 and (np.diff(newlines) == stride).all():
+        grid = data.reshape(-1, stride)[:, :-1]
+        carriage_returns = grid[:, -1] == CARRIAGE_RETURN if grid.shape[1] else np.zeros(1, bool)
+        if carriage_returns.all():
+            return grid[:, :-1]
+        if not carriage_returns.any():
+            return grid
+
+    rows = bytes(data).splitlines()
+    grid = np.full((len(rows), max(map(len, rows), default=0)), PERIOD, dtype=np.uint8)
+    for y, row in enumerate(rows):
+        grid[y, :len(row)] = np.frombuffer(row, dtype=np.uint8)
+
+    return grid
+
+
+class SchematicMasks:
+
+    def __init__(self, grid: np.ndarray, symbols: str = SYMBOLS) -> None:
+        # A border of periods keeps digit runs on their row and neighbors in bounds
+        padded = np.pad(grid, 1, constant_values=PERIOD)
+        height, width = grid.shape
+
+        flat = padded.ravel()
+        starts, _, self.values = digit_runs(flat)
+        is_digit = (flat >= ZERO) & (flat <= NINE)
+        run_starts = np.zeros(len(flat), dtype=np.int64)
+        run_starts[starts] = 1
+        self.labels = np.where(is_digit, np.cumsum(run_starts) - 1, NO_NUMBER).reshape(padded.shape)
+
+        self.is_symbol = symbol_table(symbols)[padded]
+        self.near_symbol = np.zeros_like(self.is_symbol)
+        for dy, dx in NEIGHBORHOOD:
+            self.near_symbol[1:-1, 1:-1] |= self.is_symbol[1 + dy: height + 1 + dy,
+                                                          1 + dx: width + 1 + dx]
+
+    @classmethod
+    def from_file(cls, input_file: str, symbols: str = SYMBOLS) -> "SchematicMasks":
+        return cls(read_grid(np.fromfile(input_file, dtype=np.uint8)), symbols)
+
+    def part_number_sum(self) -> int:
+        touched = np.zeros(len(self.values), dtype=bool)
+        touched[self.labels[self.near_symbol & (self.labels != NO_NUMBER)]] = True
+
+        return int(self.values[touched].sum())
+
+    def gear_ratio_sum(self, required: int = 2) -> int:
+        """
+        Sum of the products of the numbers around every symbol touching exactly `required`
+        """
+        ys, xs = np.nonzero(self.is_symbol)
+        around = np.sort(np.stack([self.labels[ys + dy, xs + dx] for dy, dx in NEIGHBORHOOD],
+                                  axis=1), axis=1)
+        # A number is counted once, at the first of its cells in the sorted labels
+        distinct = around != NO_NUMBER
+        distinct[:, 1:] &= around[:, 1:] != around[:, :-1]
+
+        gears = distinct.sum(axis=1) == required
+        numbers = np.where(distinct[gears], self.values[around[gears]], 1)
+        return int(numbers.prod(axis=1).sum())
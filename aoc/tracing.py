@@ -0,0 +1,97 @@
+"""
+Timeline spans of solver phases, exported in the Chrome trace event format
+
+Open the written `trace.json` in https://ui.perfetto.dev or chrome://tracing.
+Like `profiling`, tracing is disabled by default and then costs nothing for
+decorated functions, so enable it (`AOC_TRACE=1` or `enable()`) before the
+solver module is imported. Spans nest by time, and events of worker processes
+land on their own tracks: timestamps come from the system-wide monotonic clock,
+so spans of parallel workers line up on one timeline.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+ENABLED = os.environ.get("AOC_TRACE", "0") == "1"
+
+_events: list[dict[str, Any]] = []
+
+
+def enable() -> None:
+    global ENABLED
+    ENABLED = True
+
+
+def reset() -> None:
+    _events.clear()
+
+
+def _now_us() -> float:
+    return time.monotonic_ns() / 1000
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    if not ENABLED:
+        yield
+        return
+
+    start = _now_us()
+    try:
+        yield
+    finally:
+        _events.append({"name": name,
+                        "cat": name.split(".", 1)[0],
+                        "ph": "X",
+                        "ts": start,
+                        "dur": _now_us() - start,
+                        "pid": os.getpid(),
+                        "tid": threading.get_ident(),
+                        "args": args})
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Record a span for every call of the decorated function
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def name_process(name: str) -> None:
+    """
+    Label the track of the current process in the viewer
+    """
+    if ENABLED:
+        _events.append({"name": "process_name",
+                        "ph": "M",
+                        "pid": os.getpid(),
+                        "args": {"name": name}})
+
+
+def events() -> list[dict[str, Any]]:
+    return list(_events)
+
+
+def write_trace(path: str, trace_events: list[dict[str, Any]]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
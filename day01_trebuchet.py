@@ -1,43 +1,96 @@
+import os
 import sys
+from typing import Any, Iterable
 
+from aoc import output
+from aoc.digit_scan import DIGITS, DigitScanner
+from aoc.mapped import read_rows
 
-def solve(lines: list[str]) -> int:
+INPUT_FILE = "inputs/day1.txt"
+# INPUT_FILE = "inputs/day1_sample.txt"
+
+scanner = DigitScanner(DIGITS)
+
+# Bytes handed to NumPy at once by the vectorized mode, cut at a newline
+CHUNK_BYTES = 64 * 1024 * 1024
+NEWLINE = ord("\n")
+ZERO = ord("0")
+NINE = ord("9")
+
+
+def solve(lines: Iterable[str]) -> int:
     """
     On each row, Find the first digit and last digit and sum them
     Adding all sums will give you the answer
     """
+    return scanner.calibration_sum(lines)
+
+
+def process_input(input_file: str = INPUT_FILE) -> list[str]:
+    return read_rows(input_file)
+
+
+def solve_stream(lines: Iterable[str]) -> int:
+    return solve(lines)
+
+
+def _calibration_sum(chunk: Any) -> int:
+    """
+    Whole lines of bytes, the first and last digit of each line are the first
+    and last digit positions of each run of digit positions sharing a line number
+    """
+    import numpy as np
 
-    def get_digits(line: str) -> str:
-        digits = ""
-        for char in line:
-            if char in ALL_DIGITS:
-                digits += char
+    digit_positions = np.flatnonzero((chunk >= ZERO) & (chunk <= NINE))
+    if not len(digit_positions):
+        return 0
 
-        return digits
+    newlines = np.flatnonzero(chunk == NEWLINE)
+    line_numbers = np.searchsorted(newlines, digit_positions)
+    new_line = np.flatnonzero(np.diff(line_numbers)) + 1
+    firsts = digit_positions[np.concatenate(([0], new_line))]
+    lasts = digit_positions[np.concatenate((new_line - 1, [len(digit_positions) - 1]))]
 
-    sum = 0
-    ALL_DIGITS = "0123456789"
-    for line in lines:
-        digits = get_digits(line)
+    first_digits = chunk[firsts].astype(np.int64) - ZERO
+    last_digits = chunk[lasts].astype(np.int64) - ZERO
+    return int(10 * first_digits.sum() + last_digits.sum())
+
+
+def solve_vectorized(input_file: str = INPUT_FILE) -> int:
+    """
+    Same answer as `solve()` without a Python loop per line: the file is mapped as
+    uint8 and handled in chunks of whole lines, so memory stays bounded on huge inputs
+    """
+    import numpy as np
 
-        if not digits:
-            continue
+    size = os.path.getsize(input_file)
+    if not size:
+        return 0
+    buffer = np.memmap(input_file, dtype=np.uint8, mode="r")
 
-        row_sum = 10 * int(digits[0]) + int(digits[-1])
-        sum += row_sum
+    total = 0
+    start = 0
+    while start < size:
+        end = min(start + CHUNK_BYTES, size)
+        if end < size:
+            newlines = np.flatnonzero(buffer[start:end] == NEWLINE)
+            # A single line longer than a chunk is handled whole
+            end = start + newlines[-1] + 1 if len(newlines) else _next_line(buffer, end)
+        total += _calibration_sum(buffer[start:end])
+        start = end
 
-    return sum
+    return total
 
 
-def process_input() -> list[str]:
-    with open("inputs/day1.txt", "r") as f:
-        lines = f.readlines()
+def _next_line(buffer: Any, offset: int) -> int:
+    import numpy as np
 
-    return lines
+    newlines = np.flatnonzero(buffer[offset:] == NEWLINE)
+    return offset + newlines[0] + 1 if len(newlines) else len(buffer)
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
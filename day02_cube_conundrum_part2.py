@@ -18,72 +18,36 @@ Game 4 required at least 14 red, 3 green, and 15 blue cubes.
 Game 5 needed no fewer than 6 red, 3 green, and 2 blue cubes in the bag.
 """
 
+from typing import Iterable
 
-class GameParser:
+import numpy as np
 
-    MAX_RED = 12
-    MAX_GREEN = 13
-    MAX_BLUE = 14
+from aoc import output
+from aoc.game_records import GameRecords, iter_batches
+from aoc.parse_cache import cached
 
-    def __init__(self, game_info: str) -> None:
-        self.ball_counter = {
-            "red": 0,
-            "green": 0,
-            "blue": 0
-        }
-        self.parse_game_info(game_info)
+INPUT_FILE = "inputs/day2.txt"
+# INPUT_FILE = "inputs/day2_sample.txt"
 
-    def parse_game_info(self, game_info: str) -> None:
-        self.game_title, self.game = game_info.split(":")
-        self._parse_game_title()
-        self._parse_game()
 
-    def _parse_game_title(self) -> None:
-        no = self.game_title.split()[1]
-        self.game_no = int(no)
+def solve(games: GameRecords) -> int:
+    """
+    Sum of the powers of the fewest cubes of each color every game needs
+    """
+    return games.power_sum()
 
-    def _parse_game(self) -> None:
-        for round in self.game.split(";"):
-            round = round.strip()
-            self._parse_round(round)
 
-    def _parse_round(self, round: str) -> None:
-        for pick in round.split(","):
-            num, ball = pick.strip().split()
-            self.ball_counter[ball] = max(self.ball_counter[ball],
-                                          int(num))
+@cached(version=2)
+def process_input(input_file: str = INPUT_FILE) -> GameRecords:
+    return GameRecords.from_buffer(np.fromfile(input_file, dtype=np.uint8))
 
-    @property
-    def power(self) -> int:
-        return (self.ball_counter["red"]
-                * self.ball_counter["green"]
-                * self.ball_counter["blue"])
 
-    def __repr__(self) -> str:
-        return f"Game {self.game_no}, {self.ball_counter}"
-
-
-def solve(lines: list[str]) -> int:
-
-    sum = 0
-    for line in lines:
-        game = GameParser(line)
-        # print(game)
-        sum += game.power
-
-    return sum
-
-
-def process_input() -> list[str]:
-    with open("inputs/day2.txt", "r") as f:
-        # with open("inputs/day2_sample.txt", "r") as f:
-        lines = f.readlines()
-
-    return lines
+def solve_stream(lines: Iterable[str]) -> int:
+    return sum(solve(games) for games in iter_batches(lines))
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
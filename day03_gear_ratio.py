@@ -21,92 +21,36 @@ In this schematic, two numbers are not part numbers because they are not adjacen
 Of course, the actual engine schematic is much larger. What is the sum of all of the part numbers in the engine schematic?
 """
 
-import string
-from enum import Enum
+from aoc import output
+from aoc.mapped import read_rows
+from aoc.schematic import Schematic
 
-from rich import print
+INPUT_FILE = "inputs/day3.txt"
+# INPUT_FILE = "inputs/day3_sample.txt"
 
 
-class Direction(Enum):
-    up = (-1, 0)
-    down = (1, 0)
-    left = (0, -1)
-    right = (0, 1)
-    up_left = (-1, -1)
-    up_right = (-1, 1)
-    down_left = (1, -1)
-    down_right = (1, 1)
+def solve(schematic: Schematic) -> int:
+    part_numbers = schematic.part_numbers()
 
-
-def solve(lines: list[str]) -> int:
-
-    def collect_part_numbers(y: int, x: int) -> None:
-        for dir in Direction:
-            y_dir, x_dir = dir.value
-            y_neighbor, x_neighbor = y + y_dir, x + x_dir
-
-            if oob(y_neighbor, x_neighbor):
-                continue
-
-            if lines[y_neighbor][x_neighbor] not in string.digits:
-                continue
-
-            number = collect_part_number(y_neighbor, x_neighbor)
-
-            if number in part_numbers:
-                continue
-
-            part_numbers.add(number)
-
-    def oob(y: int, x: int) -> bool:
-        y_oob = (y < 0 or y >= len(lines))
-        x_oob = (x < 0 or x >= len(lines[0]))
-
-        return y_oob or x_oob
-
-    def collect_part_number(y: int, x: int) -> tuple[int, int, int]:
-        # Left
-        left = x - 1
-        while left >= 0 and lines[y][left] in string.digits:
-            left -= 1
-
-        # Right
-        right = x + 1
-        while right < len(lines[y]) and lines[y][right] in string.digits:
-            right += 1
-
-        return (y, left + 1, right)
-
-    symbols = set(r"""`~!@#$%^&*()_-+={[}}|\:;"'<,>?/""")
-    part_numbers = set()
-
-    # Collect part numbers on each row
-    for y in range(len(lines)):
-        for x in range(len(lines[y])):
-            if lines[y][x] not in symbols:
-                continue
-            collect_part_numbers(y, x)
-
-    print(sorted(part_numbers))
+    if output.DEBUG:
+        output.debug(sorted(schematic.spans[number_id] for number_id in part_numbers))
 
     # Add them up
-    sum = 0
-    for y, x_left, x_right in part_numbers:
-        sum += int(lines[y][x_left: x_right])
+    return sum(schematic.values[number_id] for number_id in part_numbers)
+
 
-    return sum
+def process_input(input_file: str = INPUT_FILE) -> Schematic:
+    return Schematic(read_rows(input_file))
 
 
-def process_input() -> list[str]:
-    with open("inputs/day3.txt", "r") as f:
-        # with open("inputs/day3_sample.txt", "r") as f:
-        lines = f.readlines()
+def solve_vectorized(input_file: str = INPUT_FILE) -> int:
+    from aoc.schematic_masks import SchematicMasks
 
-    return lines
+    return SchematicMasks.from_file(input_file).part_number_sum()
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
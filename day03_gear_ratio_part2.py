@@ -22,100 +22,43 @@ In this schematic, there are two gears. The first is in the top left; it has par
 What is the sum of all of the gear ratios in your engine schematic?
 """
 
-import string
-from enum import Enum
+from aoc import output
+from aoc.mapped import read_rows
+from aoc.schematic import Schematic
 
-from rich import print
+INPUT_FILE = "inputs/day3.txt"
+# INPUT_FILE = "inputs/day3_sample.txt"
 
 REQUIRED_PART_NUMBERS = 2
 
 
-class Direction(Enum):
-    up = (-1, 0)
-    down = (1, 0)
-    left = (0, -1)
-    right = (0, 1)
-    up_left = (-1, -1)
-    up_right = (-1, 1)
-    down_left = (1, -1)
-    down_right = (1, 1)
-
-
-def solve(lines: list[str]) -> int:
-
-    def collect_part_numbers(y: int, x: int) -> set[tuple[int, int, int]]:
-        current_part_numbers = set()
-        for dir in Direction:
-            y_dir, x_dir = dir.value
-            y_neighbor, x_neighbor = y + y_dir, x + x_dir
-
-            if oob(y_neighbor, x_neighbor):
-                continue
-
-            if lines[y_neighbor][x_neighbor] not in string.digits:
-                continue
-
-            number = collect_part_number(y_neighbor, x_neighbor)
-
-            current_part_numbers.add(number)
-
-        return current_part_numbers if len(current_part_numbers) == REQUIRED_PART_NUMBERS else set()
-
-    def oob(y: int, x: int) -> bool:
-        y_oob = (y < 0 or y >= len(lines))
-        x_oob = (x < 0 or x >= len(lines[0]))
-
-        return y_oob or x_oob
-
-    def collect_part_number(y: int, x: int) -> tuple[int, int, int]:
-        # Left
-        left = x - 1
-        while left >= 0 and lines[y][left] in string.digits:
-            left -= 1
-
-        # Right
-        right = x + 1
-        while right < len(lines[y]) and lines[y][right] in string.digits:
-            right += 1
-
-        return (y, left + 1, right)
+def solve(schematic: Schematic) -> int:
+    gear_ratio_sum = 0
+    for y, x in schematic.symbols:
+        part_numbers = schematic.adjacent_numbers(y, x)
+        if len(part_numbers) != REQUIRED_PART_NUMBERS:
+            continue
 
-    def compute_gear_ratio(part_numbers: set[tuple[int, int, int]]) -> int:
         gear_ratio = 1
-        for y, x_left, x_right in list(part_numbers):
-            num = int(lines[y][x_left: x_right])
-            gear_ratio *= num
-
-        return gear_ratio
+        for number_id in part_numbers:
+            gear_ratio *= schematic.values[number_id]
+        gear_ratio_sum += gear_ratio
 
-    symbols = set(r"""`~!@#$%^&*()_-+={[}}|\:;"'<,>?/""")
-    part_numbers = set()
-
-    # Collect part numbers on each row
-    gear_ratio_sum = 0
-    for y in range(len(lines)):
-        for x in range(len(lines[y])):
-            if lines[y][x] not in symbols:
-                continue
-            part_numbers = collect_part_numbers(y, x)
-            if not part_numbers:
-                continue
+    return gear_ratio_sum
 
-            gear_ratio_sum += compute_gear_ratio(part_numbers)
 
-    return gear_ratio_sum
+def process_input(input_file: str = INPUT_FILE) -> Schematic:
+    return Schematic(read_rows(input_file))
 
 
-def process_input() -> list[str]:
-    with open("inputs/day3.txt", "r") as f:
-        # with open("inputs/day3_sample.txt", "r") as f:
-        lines = f.readlines()
+def solve_vectorized(input_file: str = INPUT_FILE) -> int:
+    from aoc.schematic_masks import SchematicMasks
 
-    return lines
+    return SchematicMasks.from_file(input_file).gear_ratio_sum(REQUIRED_PART_NUMBERS)
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
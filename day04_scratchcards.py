@@ -26,7 +26,13 @@ So, in this example, the Elf's pile of scratchcards is worth 13 points.
 Take a seat in the large pile of colorful cards. How many points are they worth in total?
 """
 
-from rich import print
+from typing import Iterable
+
+from aoc import output
+from aoc.mapped import read_rows
+
+INPUT_FILE = "inputs/day4.txt"
+# INPUT_FILE = "inputs/day4_sample.txt"
 
 
 class CardSolver:
@@ -68,12 +74,13 @@ class CardSolver:
         return f"Card {self.card_no}; Winner: {self.winner_numbers}; Scratch: {self.scratch_numbers}"
 
 
-def solve(lines: list[str]) -> int:
+def solve(lines: Iterable[str]) -> int:
 
     total = 0
     for card in lines:
         solver = CardSolver(card)
-        print(solver)
+        if output.DEBUG:
+            output.debug(solver)
 
         point = 0 if solver.matches == 0 else 2 ** (solver.matches - 1)
         total += point
@@ -81,16 +88,16 @@ def solve(lines: list[str]) -> int:
     return total
 
 
-def process_input() -> list[str]:
-    # with open("inputs/day4.txt", "r") as f:
-    with open("inputs/day4_sample.txt", "r") as f:
-        lines = f.readlines()
+def process_input(input_file: str = INPUT_FILE) -> list[str]:
+    return read_rows(input_file)
+
 
-    return lines
+def solve_stream(lines: Iterable[str]) -> int:
+    return solve(lines)
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
@@ -30,8 +30,13 @@ Process all of the original and copied scratchcards until no more scratchcards a
 
 from collections import defaultdict
 from dataclasses import dataclass
+from typing import Iterable
 
-from rich import print
+from aoc import output
+from aoc.mapped import read_rows
+
+INPUT_FILE = "inputs/day4.txt"
+# INPUT_FILE = "inputs/day4_sample.txt"
 
 
 @dataclass
@@ -79,7 +84,7 @@ class CardSolver:
         return f"Card {self.card_no}; Winner: {self.winner_numbers}; Scratch: {self.scratch_numbers}"
 
 
-def solve(cards: list[str]) -> int:
+def solve(cards: Iterable[str]) -> int:
 
     card_no_to_stat = defaultdict(lambda: CardStat())
     total_cards = 0
@@ -92,7 +97,8 @@ def solve(cards: list[str]) -> int:
         card_stat = card_no_to_stat[card_no]
         card_stat.matches = solver.matches
 
-        print(f"Card {card_no}, {card_stat}")
+        if output.DEBUG:
+            output.debug(f"Card {card_no}, {card_stat}")
         total_cards += card_stat.n_cards
 
         # Add copies to the following cards
@@ -101,19 +107,22 @@ def solve(cards: list[str]) -> int:
             # Each card will give a copy to the next card
             card_no_to_stat[following_card].n_cards += card_stat.n_cards
 
+        # Only the cards ahead are still needed
+        del card_no_to_stat[card_no]
+
     return total_cards
 
 
-def process_input() -> list[str]:
-    with open("inputs/day4.txt", "r") as f:
-        # with open("inputs/day4_sample.txt", "r") as f:
-        cards = f.readlines()
+def process_input(input_file: str = INPUT_FILE) -> list[str]:
+    return read_rows(input_file)
+
 
-    return cards
+def solve_stream(lines: Iterable[str]) -> int:
+    return solve(lines)
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
@@ -86,9 +86,15 @@ So, the lowest location number in this example is 35.
 What is the lowest location number that corresponds to any of the initial seed numbers?
 """
 
+from array import array
 from dataclasses import dataclass, field
 
-from rich import print
+from aoc import output, profiling
+from aoc.integers import ints
+from aoc.parse_cache import cached
+
+INPUT_FILE = "inputs/day5.txt"
+# INPUT_FILE = "inputs/day5_sample.txt"
 
 
 @dataclass
@@ -134,6 +140,7 @@ class Almanac:
         return int(location)
 
 
+@profiling.counted("day05._get")
 def _get(range_maps: list[RangeMap],
          src: int) -> int:
     for range_map in range_maps:
@@ -166,25 +173,26 @@ class AlmanacParser:
         self._parse_maps(almanac_list[1:])
 
     def _parse_seed(self, seed_info: str) -> None:
-        seeds = seed_info.split(": ")[1].split()
-        self.seeds = [int(seed) for seed in seeds]
+        self.seeds = ints(seed_info.split(": ")[1])
 
     def _parse_maps(self, map_info: list[str]) -> None:
         for _map in map_info:
             title, detail = _map.split(maxsplit=1)
             self.current_range_maps = self.title_to_range_maps[title]
 
-            map_details = detail.split(":")[1].strip().split("\n")
+            # Every number of the map at once, three per range
+            map_details = ints(detail.split(":")[1])
             self._parse_map_details(map_details)
 
     def _parse_map_details(self,
-                           map_details: list[str]) -> None:
-        for map_detail in map_details:
-            self._parse_map_detail(map_detail)
+                           map_details: array) -> None:
+        for index in range(0, len(map_details), 3):
+            self._parse_map_detail(*map_details[index: index + 3])
 
     def _parse_map_detail(self,
-                          map_detail: str) -> None:
-        dest_category, src_category, range_len = list(map(int, map_detail.split()))
+                          dest_category: int,
+                          src_category: int,
+                          range_len: int) -> None:
         self.current_range_maps.append(RangeMap(start=src_category,
                                                 end=src_category + range_len,
                                                 map_offset=dest_category - src_category))
@@ -193,8 +201,7 @@ class AlmanacParser:
         return f"Seeds = {self.seeds};\n{self.almanac}"
 
 
-def solve(almanac_list: list[str]) -> int:
-    parser = AlmanacParser(almanac_list)
+def solve(parser: AlmanacParser) -> int:
     # print(parser)
 
     lowest_location = float("inf")
@@ -205,16 +212,16 @@ def solve(almanac_list: list[str]) -> int:
     return lowest_location  # type: ignore
 
 
-def process_input() -> list[str]:
-    with open("inputs/day5.txt", "r") as f:
-        # with open("inputs/day5_sample.txt", "r") as f:
+@cached(version=2)
+def process_input(input_file: str = INPUT_FILE) -> AlmanacParser:
+    with open(input_file, "r") as f:
         almanac_list = f.read().split("\n\n")
 
-    return almanac_list
+    return AlmanacParser(almanac_list)
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
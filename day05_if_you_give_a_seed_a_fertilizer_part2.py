@@ -17,10 +17,16 @@ Consider all of the initial seed numbers listed in the ranges on the first line
 What is the lowest location number that corresponds to any of the initial seed numbers?
 """
 
+from array import array
 from dataclasses import dataclass, field
 from typing import Optional
 
-from rich import print
+from aoc import output, profiling, tracing
+from aoc.integers import ints
+from aoc.parse_cache import cached
+
+INPUT_FILE = "inputs/day5.txt"
+# INPUT_FILE = "inputs/day5_sample.txt"
 
 
 @dataclass
@@ -52,17 +58,25 @@ class Almanac:
     humidity_to_location: list[RangeMap] = field(default_factory=list)
 
     def get_location_ranges_by_seed_ranges(self, seed_ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
-        soil_ranges = _get(self.seed_to_soil, seed_ranges)
-        fertilizer_ranges = _get(self.soil_to_fertilizer, soil_ranges)
-        water_ranges = _get(self.fertilizer_to_water, fertilizer_ranges)
-        light_ranges = _get(self.water_to_light, water_ranges)
-        temperature_ranges = _get(self.light_to_temperature, light_ranges)
-        humidity_ranges = _get(self.temperature_to_humidity, temperature_ranges)
-        location_ranges = _get(self.humidity_to_location, humidity_ranges)
+        with tracing.span("day05._get seed-to-soil"):
+            soil_ranges = _get(self.seed_to_soil, seed_ranges)
+        with tracing.span("day05._get soil-to-fertilizer"):
+            fertilizer_ranges = _get(self.soil_to_fertilizer, soil_ranges)
+        with tracing.span("day05._get fertilizer-to-water"):
+            water_ranges = _get(self.fertilizer_to_water, fertilizer_ranges)
+        with tracing.span("day05._get water-to-light"):
+            light_ranges = _get(self.water_to_light, water_ranges)
+        with tracing.span("day05._get light-to-temperature"):
+            temperature_ranges = _get(self.light_to_temperature, light_ranges)
+        with tracing.span("day05._get temperature-to-humidity"):
+            humidity_ranges = _get(self.temperature_to_humidity, temperature_ranges)
+        with tracing.span("day05._get humidity-to-location"):
+            location_ranges = _get(self.humidity_to_location, humidity_ranges)
 
         return location_ranges
 
 
+@profiling.timed("day05._get")
 def _get(range_maps: list[RangeMap],
          src_ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
 
@@ -96,6 +110,8 @@ def _get(range_maps: list[RangeMap],
 
         remained = map_range(src_start, src_end)
         if remained:
+            if profiling.ENABLED:
+                profiling.count("day05._get range splits")
             src_ranges.append(remained)
 
     # print(f"Dest: {dest_ranges}")
@@ -124,31 +140,34 @@ class AlmanacParser:
         self._parse_maps(almanac_list[1:])
 
     def _parse_seed(self, seed_info: str) -> None:
-        numbers = seed_info.split(": ")[1].split()
+        numbers = ints(seed_info.split(": ")[1])
         self.seed_ranges = []
         for index in range(0, len(numbers), 2):
-            seed_start = int(numbers[index])
-            range_len = int(numbers[index + 1])
+            seed_start = numbers[index]
+            range_len = numbers[index + 1]
             seed_end = seed_start + range_len - 1
 
             self.seed_ranges.append((seed_start, seed_end))
 
+    @tracing.traced("day05.AlmanacParser._parse_maps")
     def _parse_maps(self, map_info: list[str]) -> None:
         for _map in map_info:
             title, detail = _map.split(maxsplit=1)
             self.current_range_maps = self.title_to_range_maps[title]
 
-            map_details = detail.split(":")[1].strip().split("\n")
+            # Every number of the map at once, three per range
+            map_details = ints(detail.split(":")[1])
             self._parse_map_details(map_details)
 
     def _parse_map_details(self,
-                           map_details: list[str]) -> None:
-        for map_detail in map_details:
-            self._parse_map_detail(map_detail)
+                           map_details: array) -> None:
+        for index in range(0, len(map_details), 3):
+            self._parse_map_detail(*map_details[index: index + 3])
 
     def _parse_map_detail(self,
-                          map_detail: str) -> None:
-        dest_category, src_category, range_len = list(map(int, map_detail.split()))
+                          dest_category: int,
+                          src_category: int,
+                          range_len: int) -> None:
         self.current_range_maps.append(RangeMap(start=src_category,
                                                 end=src_category + range_len,
                                                 map_offset=dest_category - src_category))
@@ -157,10 +176,10 @@ class AlmanacParser:
         return f"Seeds = {self.seed_ranges};\n{self.almanac}"
 
 
-def solve(almanac_list: list[str]) -> int:
-    parser = AlmanacParser(almanac_list)
+def solve(parser: AlmanacParser) -> int:
     almanac = parser.almanac
-    seed_ranges = parser.seed_ranges
+    # Ranges are consumed while mapping, keep the parsed ones intact
+    seed_ranges = list(parser.seed_ranges)
     # print(parser)
 
     location_ranges = almanac.get_location_ranges_by_seed_ranges(seed_ranges)
@@ -172,16 +191,16 @@ def solve(almanac_list: list[str]) -> int:
     return lowest_location
 
 
-def process_input() -> list[str]:
-    with open("inputs/day5.txt", "r") as f:
-        # with open("inputs/day5_sample.txt", "r") as f:
+@cached(version=1)
+def process_input(input_file: str = INPUT_FILE) -> AlmanacParser:
+    with tracing.span("read", input=input_file), open(input_file, "r") as f:
         almanac_list = f.read().split("\n\n")
 
-    return almanac_list
+    return AlmanacParser(almanac_list)
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
@@ -36,7 +36,8 @@ To see how much margin of error you have, determine the number of ways you can b
 Determine the number of ways you could beat the record in each race. What do you get if you multiply these numbers together?
 """
 
-from rich import print
+from aoc import output
+from aoc.integers import int_list
 
 INPUT_FILE = "inputs/day6.txt"
 # INPUT_FILE = "inputs/day6_sample.txt"
@@ -71,12 +72,12 @@ def solve(times: list[int],
     return ways
 
 
-def process_input() -> tuple[list[int], list[int]]:
+def process_input(input_file: str = INPUT_FILE) -> tuple[list[int], list[int]]:
 
     def get_nums(info: str) -> list[int]:
-        return [int(item) for item in info.split()[1:]]
+        return int_list(info)
 
-    with open(INPUT_FILE, "r") as f:
+    with open(input_file, "r") as f:
         time_info = f.readline()
         distance_info = f.readline()
 
@@ -84,7 +85,7 @@ def process_input() -> tuple[list[int], list[int]]:
 
 
 def main() -> None:
-    print(solve(*process_input()))
+    output.answer(solve(*process_input()))
 
 
 if __name__ == "__main__":
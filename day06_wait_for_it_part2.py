@@ -16,7 +16,7 @@ Now, you have to figure out how many ways there are to win this single race. In
 Determine the number of ways you could beat the record in each race. What do you get if you multiply these numbers together?
 """
 
-from rich import print
+from aoc import output
 
 INPUT_FILE = "inputs/day6.txt"
 # INPUT_FILE = "inputs/day6_sample.txt"
@@ -54,12 +54,12 @@ def solve(time_limit: int,
     return (right_bound - left_bound + 1)
 
 
-def process_input() -> tuple[int, int]:
+def process_input(input_file: str = INPUT_FILE) -> tuple[int, int]:
 
     def get_num(info: str) -> int:
         return int("".join(info.split()[1:]))
 
-    with open(INPUT_FILE, "r") as f:
+    with open(input_file, "r") as f:
         time_info = f.readline()
         distance_info = f.readline()
 
@@ -67,7 +67,7 @@ def process_input() -> tuple[int, int]:
 
 
 def main() -> None:
-    print(solve(*process_input()))
+    output.answer(solve(*process_input()))
 
 
 if __name__ == "__main__":
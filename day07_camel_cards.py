@@ -37,8 +37,10 @@ Find the rank of every hand in your set. What are the total winnings?
 """
 
 from collections import Counter
+from typing import Iterable
 
-from rich import print
+from aoc import output
+from aoc.external_sort import external_sorted
 
 CARD_IN_ORDER = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
 _card_to_strength = {card: -index for index, card in enumerate(CARD_IN_ORDER)}
@@ -76,20 +78,34 @@ def rank(hand_and_bit: tuple[str, int]) -> tuple[list[int], list[int]]:
     return _type, strength
 
 
-def process_input() -> list[tuple[str, int]]:
+def get_hand_and_bit(line: str) -> tuple[str, int]:
+    hand, bit = line.split()
+    return hand, int(bit)
 
-    def get_hand_and_bit(line: str) -> tuple[str, int]:
-        hand, bit = line.split()
-        return hand, int(bit)
 
-    with open(INPUT_FILE, "r") as f:
+def process_input(input_file: str = INPUT_FILE) -> list[tuple[str, int]]:
+
+    with open(input_file, "r") as f:
         lines = f.readlines()
 
     return [get_hand_and_bit(line) for line in lines]
 
 
+def solve_stream(lines: Iterable[str]) -> int:
+    """
+    Hands are ranked with an external sort, so only a chunk of them is held in memory
+    """
+    hands_and_bits = (get_hand_and_bit(line) for line in lines)
+
+    bits = 0
+    for index, (hand, bit) in enumerate(external_sorted(hands_and_bits, key=rank)):
+        bits += (index + 1) * bit
+
+    return bits
+
+
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
@@ -32,7 +32,8 @@ Starting at AAA, follow the left/right instructions. How many steps are required
 import re
 from dataclasses import dataclass
 
-from rich import print
+from aoc import output
+from aoc.parse_cache import cached
 
 
 @dataclass
@@ -73,9 +74,10 @@ def solve(instruction: str,
     return steps
 
 
-def process_input() -> tuple[str, dict[str, Neighbor]]:
+@cached(version=1)
+def process_input(input_file: str = INPUT_FILE) -> tuple[str, dict[str, Neighbor]]:
 
-    with open(INPUT_FILE, "r") as f:
+    with open(input_file, "r") as f:
         lines = f.readlines()
 
     instruction = lines[0].strip()
@@ -99,7 +101,7 @@ def create_node_to_neighbor(lines: list[str]) -> dict[str, Neighbor]:
 
 
 def main() -> None:
-    print(solve(*process_input()))
+    output.answer(solve(*process_input()))
 
 
 if __name__ == "__main__":
@@ -35,7 +35,8 @@ import math
 import re
 from dataclasses import dataclass
 
-from rich import print
+from aoc import output
+from aoc.parse_cache import cached
 
 
 @dataclass
@@ -84,9 +85,10 @@ def solve(instruction: str,
     return math.lcm(*node_steps)
 
 
-def process_input() -> tuple[str, list[str], dict[str, Neighbor]]:
+@cached(version=1)
+def process_input(input_file: str = INPUT_FILE) -> tuple[str, list[str], dict[str, Neighbor]]:
 
-    with open(INPUT_FILE, "r") as f:
+    with open(input_file, "r") as f:
         lines = f.readlines()
 
     instruction = lines[0].strip()
@@ -114,7 +116,7 @@ def preprocess(lines: list[str]) -> tuple[list[str], dict[str, Neighbor]]:
 
 
 def main() -> None:
-    print(solve(*process_input()))
+    output.answer(solve(*process_input()))
 
 
 if __name__ == "__main__":
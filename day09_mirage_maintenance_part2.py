@@ -20,13 +20,17 @@ Analyze your OASIS report again, this time extrapolating the previous value for
 
 """
 
-from rich import print
+from typing import Iterable
+
+from aoc import output
+from aoc.integers import int_list
+from aoc.mapped import MappedInput
 
 INPUT_FILE = "inputs/day9.txt"
 # INPUT_FILE = "inputs/day9_sample.txt"
 
 
-def solve(hist_nums: list[list[int]]):
+def solve(hist_nums: Iterable[list[int]]):
 
     def extrapolate(hist_row: list[int]) -> list[list[int]]:
         all_diffs = [hist_row]
@@ -64,17 +68,18 @@ def solve(hist_nums: list[list[int]]):
     return total
 
 
-def process_input() -> list[list[int]]:
+def process_input(input_file: str = INPUT_FILE) -> list[list[int]]:
+
+    with MappedInput(input_file) as mapped:
+        return [int_list(mapped[start:end]) for start, end in mapped.line_spans()]
 
-    with open(INPUT_FILE, "r") as f:
-        lines = f.readlines()
 
-    return [[int(num) for num in nums.strip().split()]
-            for nums in lines]
+def solve_stream(lines: Iterable[str]) -> int:
+    return solve(int_list(line) for line in lines)
 
 
 def main() -> None:
-    print(solve(process_input()))
+    output.answer(solve(process_input()))
 
 
 if __name__ == "__main__":
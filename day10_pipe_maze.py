@@ -39,7 +39,8 @@ Here's the more complex loop again:
 import math
 from enum import Enum, auto
 
-from rich import print
+from aoc import output, profiling
+from aoc.mapped import MappedInput
 
 START = "S"
 GROUND = "."
@@ -104,6 +105,7 @@ class Solution:
 
             return y_oob or x_oob
 
+        @profiling.counted("day10.detect_cycle")
         def detect_cycle(node: tuple[int, int],
                          parent: tuple[int, int],
                          path_length: int = 0) -> bool:
@@ -155,7 +157,7 @@ class Solution:
         y, x = source
         source_tile = guess_tile(y, x)
         # print(tiles)
-        print(f"Guess the source tile: {source_tile}")
+        output.debug(f"Guess the source tile: {source_tile}")
         tiles[y][x] = source_tile
 
         # DFS
@@ -166,25 +168,19 @@ class Solution:
         return self.farthest
 
 
-def process_input() -> tuple[tuple[int, int], list[list[str]]]:
+def process_input(input_file: str = INPUT_FILE) -> tuple[tuple[int, int], list[list[str]]]:
 
-    def get_source(lines: list[list[str]]) -> tuple[int, int]:
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                if char == START:
-                    return y, x
-        return -1, -1
+    with MappedInput(input_file) as mapped:
+        lines = [list(str(line, "utf-8")) for line in mapped.lines()]
 
-    with open(INPUT_FILE, "r") as f:
-        lines = [list(line.strip()) for line in f.readlines()]
-
-    source = get_source(lines)
+        offset = mapped.find(START.encode())
+        source = mapped.coordinates(offset) if offset != -1 else (-1, -1)
 
     return source, lines
 
 
 def main() -> None:
-    print(Solution().solve(*process_input()))
+    output.answer(Solution().solve(*process_input()))
 
 
 if __name__ == "__main__":
@@ -193,4 +189,4 @@ if __name__ == "__main__":
     start = time.time()
     sys.setrecursionlimit(200000)
     main()
-    print(f"{(time.time() - start) * 1000} ms")
+    output.info(f"{(time.time() - start) * 1000} ms")
@@ -98,7 +98,8 @@ Figure out whether you have time to search for the nest by calculating the area
 
 from enum import Enum, auto
 
-from rich import print
+from aoc import output, profiling
+from aoc.mapped import MappedInput
 
 START = "S"
 GROUND = "."
@@ -163,6 +164,7 @@ class Solution:
 
             return y_oob or x_oob
 
+        @profiling.counted("day10.detect_cycle")
         def detect_cycle(node: tuple[int, int],
                          parent: tuple[int, int],
                          path: list[tuple[int, int]]) -> bool:
@@ -214,7 +216,7 @@ class Solution:
         y, x = source
         source_tile = guess_tile(y, x)
         # print(tiles)
-        print(f"Guess the source tile: {source_tile}")
+        output.debug(f"Guess the source tile: {source_tile}")
         tiles[y][x] = source_tile
 
         # DFS
@@ -231,7 +233,10 @@ class Solution:
         return interior_points
 
     def _print_loop(self, m: int, n: int) -> None:
-        print(self.loop)
+        if not output.DEBUG:
+            return
+
+        output.debug(self.loop)
         loop_mat = [
             ["  " for _ in range(n)]
             for _ in range(m)
@@ -239,7 +244,7 @@ class Solution:
         for index, (y, x) in enumerate(self.loop):
             loop_mat[y][x] = str(index).rjust(2)
 
-        print(loop_mat)
+        output.debug(loop_mat)
 
 
 def picks_theorem(boundary_points: int,
@@ -261,25 +266,19 @@ def shoelace_formula(loop: list[tuple[int, int]]) -> int:
     return int(abs(area / 2))
 
 
-def process_input() -> tuple[tuple[int, int], list[list[str]]]:
-
-    def get_source(lines: list[list[str]]) -> tuple[int, int]:
-        for y, line in enumerate(lines):
-            for x, char in enumerate(line):
-                if char == START:
-                    return y, x
-        return -1, -1
+def process_input(input_file: str = INPUT_FILE) -> tuple[tuple[int, int], list[list[str]]]:
 
-    with open(INPUT_FILE, "r") as f:
-        lines = [list(line.strip()) for line in f.readlines()]
+    with MappedInput(input_file) as mapped:
+        lines = [list(str(line, "utf-8")) for line in mapped.lines()]
 
-    source = get_source(lines)
+        offset = mapped.find(START.encode())
+        source = mapped.coordinates(offset) if offset != -1 else (-1, -1)
 
     return source, lines
 
 
 def main() -> None:
-    print(Solution().solve(*process_input()))
+    output.answer(Solution().solve(*process_input()))
 
 
 if __name__ == "__main__":
@@ -288,4 +287,4 @@ if __name__ == "__main__":
     start = time.time()
     sys.setrecursionlimit(200000)
     main()
-    print(f"{(time.time() - start) * 1000} ms")
+    output.info(f"{(time.time() - start) * 1000} ms")
@@ -74,7 +74,9 @@ Expand the universe, then find the length of the shortest path between every pai
 
 
 import numpy as np
-from rich import print
+
+from aoc import output
+from aoc.mapped import MappedInput
 
 # IO constants
 INPUT_FILE = "inputs/day11.txt"
@@ -88,6 +90,7 @@ _char_to_int = {
     ".": EMPTY,
     "#": GALAXY
 }
+_byte_to_int = {ord(char): val for char, val in _char_to_int.items()}
 
 
 class Solution:
@@ -154,21 +157,21 @@ class Solution:
         return sum_of_dist
 
 
-def process_input() -> list[list[int]]:
+def process_input(input_file: str = INPUT_FILE) -> list[list[int]]:
 
-    with open(INPUT_FILE, "r") as f:
-        lines = [[_char_to_int[char] for char in line.strip()]
-                 for line in f.readlines()]
+    with MappedInput(input_file) as mapped:
+        lines = [[_byte_to_int[byte] for byte in line]
+                 for line in mapped.lines()]
 
     return lines
 
 
 def main() -> None:
-    print(Solution().solve(process_input()))
+    output.answer(Solution().solve(process_input()))
 
 
 if __name__ == "__main__":
     import time
     start = time.time()
     main()
-    print(f"{(time.time() - start) * 1000} ms")
+    output.info(f"{(time.time() - start) * 1000} ms")
@@ -15,7 +15,8 @@ import itertools
 from dataclasses import dataclass
 from typing import Generator
 
-from rich import print
+from aoc import output
+from aoc.mapped import MappedInput
 
 # IO constants
 INPUT_FILE = "inputs/day11.txt"
@@ -109,23 +110,21 @@ class Solution:
         return sum_of_dist
 
 
-def process_input() -> list[list[Space]]:
+def process_input(input_file: str = INPUT_FILE) -> list[list[Space]]:
 
-    with open(INPUT_FILE, "r") as f:
-        lines = [list(line.strip()) for line in f.readlines()]
-        # print(lines)
-        image = [[Space(val=char) for char in line]
-                 for line in lines]
+    with MappedInput(input_file) as mapped:
+        image = [[Space(val=char) for char in str(line, "utf-8")]
+                 for line in mapped.lines()]
 
     return image
 
 
 def main() -> None:
-    print(Solution().solve(process_input()))
+    output.answer(Solution().solve(process_input()))
 
 
 if __name__ == "__main__":
     import time
     start = time.time()
     main()
-    print(f"{(time.time() - start) * 1000} ms")
+    output.info(f"{(time.time() - start) * 1000} ms")
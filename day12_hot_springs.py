@@ -28,9 +28,10 @@ Equipped with this information, it is your job to figure out how many different
 
 import itertools
 from dataclasses import dataclass
-from typing import Generator
+from typing import Generator, Iterable
 
-from rich import print
+from aoc import output
+from aoc.integers import int_list
 
 # IO constants
 INPUT_FILE = "inputs/day12.txt"
@@ -49,7 +50,7 @@ class Solution:
         ...
 
     def solve(self,
-              spring_records: list[tuple[list[str], list[int]]]) -> int:
+              spring_records: Iterable[tuple[list[str], list[int]]]) -> int:
 
         def is_correct(guess_record: list[str]) -> bool:
             arrangement = [len(group) for group in "".join(guess_record).split(OPERATIONAL) if group]
@@ -77,24 +78,29 @@ class Solution:
         return self.arrangement
 
 
-def process_input() -> list[tuple[list[str], list[int]]]:
+def proc_line(line: str) -> tuple[list[str], list[int]]:
+    springs, correct_arrangement = line.strip().split()
+    return list(springs), int_list(correct_arrangement)
 
-    def proc_line(line: str) -> tuple[list[str], list[int]]:
-        springs, correct_arrangement = line.strip().split()
-        return list(springs), list(map(int, correct_arrangement.split(",")))
 
-    with open(INPUT_FILE, "r") as f:
+def process_input(input_file: str = INPUT_FILE) -> list[tuple[list[str], list[int]]]:
+
+    with open(input_file, "r") as f:
         lines = [proc_line(line) for line in f.readlines()]
 
     return lines
 
 
+def solve_stream(lines: Iterable[str]) -> int:
+    return Solution().solve(proc_line(line) for line in lines)
+
+
 def main() -> None:
-    print(Solution().solve(process_input()))
+    output.answer(Solution().solve(process_input()))
 
 
 if __name__ == "__main__":
     import time
     start = time.time()
     main()
-    print(f"{(time.time() - start) * 1000} ms")
+    output.info(f"{(time.time() - start) * 1000} ms")
@@ -31,8 +31,10 @@ Unfold your condition records; what is the new sum of possible arrangement count
 
 from collections import deque
 from dataclasses import dataclass
+from typing import Iterable
 
-from rich import print
+from aoc import output, profiling
+from aoc.integers import int_list
 
 # IO constants
 INPUT_FILE = "inputs/day12.txt"
@@ -83,7 +85,7 @@ class Solution:
         self.cache = {}
         self.cache_hits = 0
 
-    def solve(self, rows: list[Row]) -> int:
+    def solve(self, rows: Iterable[Row]) -> int:
 
         total_arrangement = 0
         for row in rows:
@@ -91,9 +93,12 @@ class Solution:
             arrangement = self.count_arrangement(row)
             # print(f"{row}, {arrangement}")
             total_arrangement += arrangement
+            # Cached states never carry over to another row
+            self.cache.clear()
         # print(self.cache_hits)
         return total_arrangement
 
+    @profiling.counted("day12.count_arrangement")
     def count_arrangement(self,
                           row: Row,
                           n_damaged: int = 0) -> int:
@@ -174,25 +179,30 @@ class Solution:
         return Row(spring_states, damaged_groups)
 
 
-def process_input() -> list[Row]:
+def proc_line(line: str) -> Row:
+    spring_states, damaged_groups = line.strip().split()
+    return Row(deque(spring_states),
+               deque(int_list(damaged_groups)))
 
-    def proc_line(line: str) -> Row:
-        spring_states, damaged_groups = line.strip().split()
-        return Row(deque(spring_states),
-                   deque(map(int, damaged_groups.split(","))))
 
-    with open(INPUT_FILE, "r") as f:
+def process_input(input_file: str = INPUT_FILE) -> list[Row]:
+
+    with open(input_file, "r") as f:
         rows = [proc_line(line) for line in f.readlines()]
 
     return rows
 
 
+def solve_stream(lines: Iterable[str]) -> int:
+    return Solution().solve(proc_line(line) for line in lines)
+
+
 def main() -> None:
-    print(Solution().solve(process_input()))
+    output.answer(Solution().solve(process_input()))
 
 
 if __name__ == "__main__":
     import time
     start = time.time()
     main()
-    print(f"{(time.time() - start) * 1000} ms")
+    output.info(f"{(time.time() - start) * 1000} ms")
@@ -30,8 +30,10 @@ Unfold your condition records; what is the new sum of possible arrangement count
 # Reference: https://github.com/crunkyball/AdventOfCode2023/blob/main/Source/Days/Day12.cpp#L73
 
 from dataclasses import dataclass
+from typing import Iterable
 
-from rich import print
+from aoc import output, profiling
+from aoc.integers import int_list
 
 # IO constants
 INPUT_FILE = "inputs/day12.txt"
@@ -79,8 +81,9 @@ class Solution:
         self.cache = {}
         self.cache_hits = 0
 
-    def solve(self, rows: list[Row]) -> int:
+    def solve(self, rows: Iterable[Row]) -> int:
 
+        @profiling.counted("day12.count_arrangement")
         def count_arrangement(row: Row,
                               n_damaged: int = 0) -> int:
             key = (row, n_damaged)
@@ -149,7 +152,9 @@ class Solution:
             arrangement = count_arrangement(row)
             # print(f"{row}, {arrangement}")
             total_arrangement += arrangement
-        print(self.cache_hits)
+            # Cached states never carry over to another row
+            self.cache.clear()
+        output.debug(self.cache_hits)
         return total_arrangement
 
     @staticmethod
@@ -160,25 +165,30 @@ class Solution:
         return Row(spring_states, damaged_groups)
 
 
-def process_input() -> list[Row]:
+def proc_line(line: str) -> Row:
+    spring_states, damaged_groups = line.strip().split()
+    return Row(spring_states,
+               tuple(int_list(damaged_groups)))
 
-    def proc_line(line: str) -> Row:
-        spring_states, damaged_groups = line.strip().split()
-        return Row(spring_states,
-                   tuple(map(int, damaged_groups.split(","))))
 
-    with open(INPUT_FILE, "r") as f:
+def process_input(input_file: str = INPUT_FILE) -> list[Row]:
+
+    with open(input_file, "r") as f:
         rows = [proc_line(line) for line in f.readlines()]
 
     return rows
 
 
+def solve_stream(lines: Iterable[str]) -> int:
+    return Solution().solve(proc_line(line) for line in lines)
+
+
 def main() -> None:
-    print(Solution().solve(process_input()))
+    output.answer(Solution().solve(process_input()))
 
 
 if __name__ == "__main__":
     import time
     start = time.time()
     main()
-    print(f"{(time.time() - start) * 1000} ms")
+    output.info(f"{(time.time() - start) * 1000} ms")
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+import day01_trebuchet
+from aoc.generators import calibration_lines
+
+
+def random_text(rng):
+    """
+    Calibration lines mixed with lines without digits, blank lines and long lines
+    """
+    lines = calibration_lines(rng.randrange(1, 50), rng).splitlines()
+    lines += ["".join(rng.choices("abcxyz", k=rng.randrange(10))) for _ in range(rng.randrange(5))]
+    lines += ["".join(rng.choices("ab12", k=rng.randrange(100, 300)))]
+    rng.shuffle(lines)
+    text = "\n".join(lines)
+    return text if rng.random() < 0.5 else text + "\n"
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 16, 256, day01_trebuchet.CHUNK_BYTES])
+def test_vectorized_matches_scalar(tmp_path, monkeypatch, chunk_bytes):
+    monkeypatch.setattr(day01_trebuchet, "CHUNK_BYTES", chunk_bytes)
+    rng = random.Random(chunk_bytes)
+    input_file = tmp_path / "day1.txt"
+    for _ in range(50):
+        input_file.write_text(random_text(rng))
+        expected = day01_trebuchet.solve(day01_trebuchet.process_input(str(input_file)))
+        assert day01_trebuchet.solve_vectorized(str(input_file)) == expected
+
+
+def test_vectorized_empty_input(tmp_path):
+    input_file = tmp_path / "day1.txt"
+    input_file.write_text("")
+    assert day01_trebuchet.solve_vectorized(str(input_file)) == 0
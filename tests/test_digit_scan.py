@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from aoc.digit_scan import (DIGITS, ENGINES, ENGLISH, ROMAN, TAIL_WINDOW, DigitScanner,
+                            build_scanner)
+
+
+def brute_force(vocabulary, line):
+    """
+    Value of the token starting first and of the one ending last, the longest on a tie
+    """
+    matches = [(start, token) for start in range(len(line))
+               for token in vocabulary if line.startswith(token, start)]
+    if not matches:
+        return None, None
+    first = min(matches, key=lambda match: (match[0], -len(match[1])))
+    last = max(matches, key=lambda match: (match[0] + len(match[1]), len(match[1])))
+    return vocabulary[first[1]], vocabulary[last[1]]
+
+
+def random_line(rng, vocabulary, filler):
+    parts = [rng.choice(filler) * rng.randrange(2 * TAIL_WINDOW) for _ in range(rng.randrange(4))]
+    parts += rng.choices(list(vocabulary), k=rng.randrange(4))
+    rng.shuffle(parts)
+    return "".join(parts)
+
+
+@pytest.mark.parametrize("vocabulary, filler", [(DIGITS, "ab"),
+                                                ({**DIGITS, **ENGLISH}, "xen"),
+                                                (ROMAN, "aIV")])
+def test_matches_brute_force(vocabulary, filler):
+    rng = random.Random(0)
+    scanner = DigitScanner(vocabulary)
+    for _ in range(2000):
+        line = random_line(rng, vocabulary, filler)
+        assert scanner.first_last(line) == brute_force(vocabulary, line), line
+
+
+def test_token_across_tail_window():
+    line = "VIII" + "a" * (TAIL_WINDOW - 2)
+    assert DigitScanner(ROMAN).last(line) == 8
+    assert brute_force(ROMAN, line)[1] == 8
+
+
+@pytest.mark.parametrize("vocabulary, filler", [({**DIGITS, **ENGLISH}, "xen"),
+                                                (ROMAN, "aIV")])
+def test_engines_agree(vocabulary, filler):
+    rng = random.Random(1)
+    regex, automaton = (build_scanner(vocabulary, engine) for engine in ENGINES)
+    for _ in range(2000):
+        line = random_line(rng, vocabulary, filler)
+        assert automaton.first_last(line) == regex.first_last(line), line
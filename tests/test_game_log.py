@@ -0,0 +1,92 @@
+import json
+import random
+
+from aoc.game_log import GameLogFollower
+from aoc.game_records import GameRecords
+from aoc.generators import game_records
+
+BAG = (12, 13, 14)
+
+
+def expected(text):
+    """
+    (games, part 1, part 2) of the complete lines of the text
+    """
+    complete = text[:text.rfind(b"\n") + 1]
+    games = GameRecords.from_buffer(complete)
+    return len(games), games.id_sum(*BAG), games.power_sum()
+
+
+def answers(checkpoint):
+    return checkpoint.games, checkpoint.id_sum, checkpoint.power_sum
+
+
+def test_appends_in_random_pieces(tmp_path):
+    rng = random.Random(0)
+    text = game_records(500, rng).encode()
+    log_file = tmp_path / "games.log"
+    log_file.write_bytes(b"")
+    follower = GameLogFollower(str(log_file), bag=BAG)
+
+    written = 0
+    while written < len(text):
+        written = min(len(text), written + rng.randrange(1, 400))
+        log_file.write_bytes(text[:written])
+        follower.update()
+        assert answers(follower.checkpoint) == expected(text[:written])
+        assert follower.checkpoint.offset == text[:written].rfind(b"\n") + 1
+
+
+def test_partial_line_waits(tmp_path):
+    log_file = tmp_path / "games.log"
+    log_file.write_bytes(b"Game 1: 3 blue, 4 red")
+    follower = GameLogFollower(str(log_file), bag=BAG)
+    assert not follower.update()
+    assert answers(follower.checkpoint) == (0, 0, 0)
+
+    log_file.write_bytes(b"Game 1: 3 blue, 4 red\nGame 2: 20 gr")
+    assert follower.update()
+    assert answers(follower.checkpoint) == (1, 1, 0)
+
+
+def test_rewritten_log_is_ingested_again(tmp_path):
+    rng = random.Random(1)
+    log_file = tmp_path / "games.log"
+    first = game_records(100, rng).encode()
+    log_file.write_bytes(first)
+    follower = GameLogFollower(str(log_file), bag=BAG)
+    follower.update()
+
+    # Shorter than the offset
+    shorter = game_records(10, rng).encode()
+    log_file.write_bytes(shorter)
+    follower.update()
+    assert answers(follower.checkpoint) == expected(shorter)
+
+    # Longer, with different bytes before the offset
+    longer = game_records(200, rng).encode()
+    assert longer[:len(shorter)] != shorter
+    log_file.write_bytes(longer)
+    follower.update()
+    assert answers(follower.checkpoint) == expected(longer)
+
+
+def test_resumes_from_checkpoint(tmp_path):
+    rng = random.Random(2)
+    text = game_records(300, rng).encode()
+    half = text[:text.index(b"\n", len(text) // 2) + 1]
+    log_file = tmp_path / "games.log"
+    log_file.write_bytes(half)
+    GameLogFollower(str(log_file), bag=BAG).update()
+    checkpoint_file = tmp_path / "games.log.checkpoint.json"
+    assert json.loads(checkpoint_file.read_text())["offset"] == len(half)
+
+    log_file.write_bytes(text)
+    resumed = GameLogFollower(str(log_file), bag=BAG)
+    assert resumed.checkpoint.offset == len(half)
+    resumed.update()
+    assert answers(resumed.checkpoint) == expected(text)
+
+    # Part 1 sums of another bag can't be reused
+    other_bag = GameLogFollower(str(log_file), bag=(1, 1, 1))
+    assert other_bag.checkpoint.offset == 0
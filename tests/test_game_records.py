@@ -0,0 +1,106 @@
+import random
+
+import numpy as np
+import pytest
+
+from aoc.game_records import BagIndex, GameRecords, iter_batches
+from aoc.generators import game_records
+
+COLORS = ("red", "green", "blue")
+
+
+def parse_lines(text):
+    """
+    Game number and most cubes of each color, line by line
+    """
+    games = []
+    for line in text.splitlines():
+        title, rounds = line.split(":")
+        maxima = dict.fromkeys(COLORS, 0)
+        for round in rounds.split(";"):
+            for pick in round.split(","):
+                count, color = pick.split()
+                maxima[color] = max(maxima[color], int(count))
+        games.append((int(title.split()[1]), *maxima.values()))
+    return games
+
+
+def columns(games):
+    return list(zip(games.game_no.tolist(), games.max_red.tolist(),
+                    games.max_green.tolist(), games.max_blue.tolist()))
+
+
+def random_text(rng):
+    text = game_records(rng.randrange(1, 200), rng)
+    if rng.random() < 0.3:
+        text = text.replace("\n", "\r\n")
+    return text if rng.random() < 0.5 else text.rstrip("\r\n")
+
+
+def test_from_buffer_matches_line_parsing():
+    rng = random.Random(0)
+    for _ in range(200):
+        text = random_text(rng)
+        expected = parse_lines(text)
+        games = GameRecords.from_buffer(text.encode())
+        assert columns(games) == expected
+
+        bag = [rng.randrange(25) for _ in COLORS]
+        assert games.id_sum(*bag) == sum(game[0] for game in expected
+                                         if all(count <= limit
+                                                for count, limit in zip(game[1:], bag)))
+        assert games.power_sum() == sum(red * green * blue for _, red, green, blue in expected)
+
+
+def test_from_lines_and_batches():
+    rng = random.Random(1)
+    text = game_records(1000, rng)
+    lines = text.splitlines()
+    assert columns(GameRecords.from_lines(lines)) == parse_lines(text)
+
+    batches = list(iter_batches(lines, size=64))
+    assert sum(map(len, batches)) == len(lines)
+    assert sum(batch.power_sum() for batch in batches) == GameRecords.from_lines(lines).power_sum()
+
+
+def test_from_buffer_array_and_empty():
+    text = game_records(10, random.Random(2))
+    buffer = np.frombuffer(text.encode(), dtype=np.uint8)
+    assert columns(GameRecords.from_buffer(buffer)) == parse_lines(text)
+    assert len(GameRecords.from_buffer(b"")) == 0
+    assert len(GameRecords.from_buffer(b"\n")) == 0
+
+
+def test_from_buffer_rejects_records_without_a_game():
+    with pytest.raises(ValueError):
+        GameRecords.from_buffer(b"3 red, 4 blue\n")
+
+
+def random_bags(rng, count):
+    return np.array([[rng.randrange(-2, 30) for _ in COLORS] for _ in range(count)])
+
+
+def test_bag_index_matches_scan():
+    rng = random.Random(3)
+    for _ in range(50):
+        games = GameRecords.from_buffer(game_records(rng.randrange(1, 300), rng).encode())
+        index = games.bag_index()
+        assert index.table is not None
+        bags = random_bags(rng, 100)
+        assert index.id_sums(bags).tolist() == [games.id_sum(*bag) for bag in bags]
+        assert index.id_sum(*bags[0]) == games.id_sum(*bags[0])
+
+
+def test_bag_index_without_table(monkeypatch):
+    monkeypatch.setattr(BagIndex, "MAX_TABLE_CELLS", 0)
+    rng = random.Random(4)
+    games = GameRecords.from_buffer(game_records(200, rng).encode())
+    index = games.bag_index()
+    assert index.table is None
+    bags = random_bags(rng, 100)
+    assert index.id_sums(bags).tolist() == [games.id_sum(*bag) for bag in bags]
+
+
+def test_bag_index_of_no_games():
+    index = GameRecords.empty().bag_index()
+    assert index.id_sums(np.array([[0, 0, 0], [12, 13, 14], [-1, 5, 5]])).tolist() == [0, 0, 0]
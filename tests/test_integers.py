@@ -0,0 +1,39 @@
+import random
+import re
+
+import pytest
+
+from aoc.integers import BULK_BYTES, int_list, ints, ints_np
+
+TOKENS = ["-", "--", " ", ",", ":", "\n", "seed-to-soil", "3-4", "Game 12:"]
+
+
+def regex_ints(data):
+    return [int(token) for token in re.findall(rb"-?\d+", data)]
+
+
+def random_buffer(rng):
+    tokens = rng.choices(TOKENS, k=rng.randrange(20))
+    tokens += [str(rng.randrange(-10 ** 12, 10 ** 12)) for _ in range(rng.randrange(20))]
+    rng.shuffle(tokens)
+    return " ".join(tokens).encode()
+
+
+@pytest.mark.parametrize("parse", [int_list, ints, ints_np])
+def test_matches_regex(parse):
+    rng = random.Random(0)
+    for _ in range(2000):
+        data = random_buffer(rng)
+        assert list(parse(data)) == regex_ints(data), data
+
+
+@pytest.mark.parametrize("line", [b"12 -5 7, 9\n", b"seeds: 79 14 55 13 seed-to-soil -3\n"])
+def test_bulk_buffers(line):
+    data = line * (BULK_BYTES // len(line) + 1)
+    assert list(ints(data)) == regex_ints(data)
+    assert ints(data.decode()) == ints(memoryview(data))
+
+
+def test_no_numbers():
+    for data in (b"", b" ", b",\n", b"-", b"a-b"):
+        assert list(ints(data)) == list(ints_np(data)) == int_list(data) == []
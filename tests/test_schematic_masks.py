@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+import day03_gear_ratio
+import day03_gear_ratio_part2
+from aoc.generators import schematic_grid
+from aoc.schematic import SYMBOLS, Schematic
+from aoc.schematic_masks import SchematicMasks, read_grid
+
+
+def random_text(rng):
+    """
+    Square grids, sometimes with ragged rows, CRLF line ends or no final newline
+    """
+    rows = schematic_grid(rng.randrange(1, 40), rng).splitlines()
+    if rng.random() < 0.3:
+        rows = [row[:rng.randrange(len(row) + 1)] for row in rows]
+    text = ("\r\n" if rng.random() < 0.3 else "\n").join(rows)
+    return text if rng.random() < 0.5 else text + "\n"
+
+
+def gear_ratio_sum(schematic, required):
+    total = 0
+    for y, x in schematic.symbols:
+        numbers = schematic.adjacent_numbers(y, x)
+        if len(numbers) == required:
+            product = 1
+            for number_id in numbers:
+                product *= schematic.values[number_id]
+            total += product
+    return total
+
+
+@pytest.mark.parametrize("symbols", [SYMBOLS, r"[^\d.]", r"\*"])
+def test_masks_match_schematic(symbols):
+    rng = random.Random(0)
+    for _ in range(200):
+        text = random_text(rng)
+        schematic = Schematic(text.splitlines(), symbols)
+        masks = SchematicMasks(read_grid(text.encode()), symbols)
+        assert masks.part_number_sum() == sum(schematic.values[number_id]
+                                              for number_id in schematic.part_numbers())
+        for required in (1, 2, 3):
+            assert masks.gear_ratio_sum(required) == gear_ratio_sum(schematic, required)
+
+
+def test_read_grid_pads_rows():
+    grid = read_grid(b"12\r\n3\r\n\r\n456")
+    assert [bytes(row) for row in grid] == [b"12.", b"3..", b"...", b"456"]
+
+
+@pytest.mark.parametrize("module", [day03_gear_ratio, day03_gear_ratio_part2])
+def test_vectorized_matches_scalar(tmp_path, module):
+    rng = random.Random(1)
+    input_file = tmp_path / "day3.txt"
+    for _ in range(30):
+        input_file.write_bytes(random_text(rng).encode())
+        expected = module.solve(module.process_input(str(input_file)))
+        assert module.solve_vectorized(str(input_file)) == expected